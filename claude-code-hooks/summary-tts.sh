@@ -46,12 +46,11 @@ cp "$transcript_path" "$SCRIPT_DIR/$SCRIPT_NAME.transcript" 2>/dev/null
 
 # POST to TTS server (send content, not path - supports remote servers)
 # Take last 100KB of transcript - server truncates parsed content to 20KB anyway
-# Pipe JSON via stdin to avoid "Argument list too long" for large transcripts
+# Send the JSONL as-is (no JSON wrapping) via stdin to avoid "Argument list too long"
 response=$(tail -c 100000 "$transcript_path" | \
-  jq -Rs '{transcript_content: .}' | \
   curl -s -X POST "${TTS_URL}/summarize" \
-    -H "Content-Type: application/json" \
-    -d @- \
+    -H "Content-Type: application/x-ndjson" \
+    --data-binary @- \
     --max-time 30 2>&1)
 
 exit_code=$?
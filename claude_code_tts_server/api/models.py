@@ -1,11 +1,18 @@
 """Pydantic models for API requests and responses."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Hooks forward the full Claude Code hook payload (session_id, hook_event_name,
+# ...), so request models must ignore unknown fields rather than forbid them.
+REQUEST_CONFIG = ConfigDict(frozen=True, extra="ignore")
+RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 
 class SummarizeRequest(BaseModel):
     """Request for the /summarize endpoint (Stop hook)."""
 
+    model_config = REQUEST_CONFIG
+
     transcript_content: str = Field(
         description="Claude Code transcript JSONL content",
     )
@@ -14,6 +21,8 @@ class SummarizeRequest(BaseModel):
 class PermissionRequest(BaseModel):
     """Request for the /permission endpoint (PermissionRequest hook)."""
 
+    model_config = REQUEST_CONFIG
+
     tool_name: str = Field(description="Name of the tool requesting permission")
     tool_input: dict = Field(description="Tool input parameters")
 
@@ -21,12 +30,16 @@ class PermissionRequest(BaseModel):
 class SpeakRequest(BaseModel):
     """Request for the /speak endpoint (direct TTS)."""
 
+    model_config = REQUEST_CONFIG
+
     text: str = Field(description="Text to convert to speech")
 
 
 class QueueStatusResponse(BaseModel):
     """Response for the /queue endpoint."""
 
+    model_config = RESPONSE_CONFIG
+
     pending_requests: int = Field(description="Requests waiting for summarization")
     pending_messages: int = Field(description="Messages waiting for TTS generation")
     ready_audio: int = Field(description="Audio files ready to play")
@@ -37,6 +50,8 @@ class QueueStatusResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Response for the /health endpoint."""
 
+    model_config = RESPONSE_CONFIG
+
     status: str = Field(description="Server status")
     tts_ready: bool = Field(description="Whether TTS backend is initialized")
     summarizer_ready: bool = Field(description="Whether summarizer is available")
@@ -46,6 +61,8 @@ class HealthResponse(BaseModel):
 class MessageResponse(BaseModel):
     """Response when a message is queued."""
 
+    model_config = RESPONSE_CONFIG
+
     message_id: str = Field(description="ID of the queued message")
     status: str = Field(description="Status message")
 
@@ -53,5 +70,7 @@ class MessageResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response."""
 
+    model_config = RESPONSE_CONFIG
+
     error: str = Field(description="Error message")
     detail: str | None = Field(default=None, description="Additional details")
@@ -1,13 +1,18 @@
 """FastAPI route definitions."""
 
-import json
+import asyncio
 import logging
+import time
+from typing import TypeVar
 
-from fastapi import APIRouter, HTTPException, Request
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from ..core.audio_manager import AudioPipeline, RequestType
 from ..core.transcript import parse_transcript
-from ..summarizers.base import SummaryType
+from ..summarizers.base import LONG_RESPONSE_MIN_CHARS, SummaryType
 from .models import (
     HealthResponse,
     MessageResponse,
@@ -21,46 +26,151 @@ log = logging.getLogger("tts-server")
 
 router = APIRouter()
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Raw JSONL transcript body accepted by /summarize
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Transcripts at least this large are parsed in a worker thread so a long
+# session's JSONL doesn't hold up other requests on the event loop. Kept
+# below the 100000 bytes summary-tts.sh sends, so full-size tails use it.
+PARSE_IN_THREAD_MIN_SIZE = 64 * 1024
+
+# Seconds to reuse a summarizer health check result across /health probes
+HEALTH_CHECK_TTL = 5.0
+
+# HealthResponse body up to queue_depth, for the all-ready case
+_HEALTH_OK_PREFIX = b'{"status":"ok","tts_ready":true,"summarizer_ready":true,"queue_depth":'
+
+# /queue/clear and /queue/skip bodies around their one variable field
+_CLEARED_PREFIX = b'{"cleared":'
+_OK_SUFFIX = b',"status":"ok"}'
+_SKIPPED_BODIES = {
+    True: b'{"skipped":true' + _OK_SUFFIX,
+    False: b'{"skipped":false' + _OK_SUFFIX,
+}
+
 
 def get_pipeline(request: Request) -> AudioPipeline:
     """Get AudioPipeline from app state."""
     return request.app.state.audio_manager
 
 
+def json_body(model: type[BaseModel]) -> dict:
+    """OpenAPI request body declaration for endpoints that decode their own body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+async def read_body(request: Request, model: type[ModelT]) -> ModelT:
+    """Decode and validate the raw request body in a single pydantic-core pass.
+
+    Skips FastAPI's body dependency (json.loads into Python objects, then
+    validation), while keeping the same 422 response on invalid input.
+    """
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        ) from e
+
+
+def json_response(model: BaseModel) -> Response:
+    """Serialize a response model with pydantic-core.
+
+    Returning a Response skips FastAPI's response_model revalidation and
+    jsonable_encoder pass; response_model on the route still drives OpenAPI.
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+def queued_response(message_id: int) -> Response:
+    """MessageResponse body for a queued request, built without a model instance."""
+    return Response(
+        orjson.dumps({"message_id": str(message_id), "status": "queued"}),
+        media_type="application/json",
+    )
+
+
+async def summarizer_ready(state) -> bool:
+    """Summarizer health, cached on app state for HEALTH_CHECK_TTL seconds.
+
+    Remote summarizers answer health_check with a network round-trip, which
+    frequent /health probes would otherwise repeat every time.
+    """
+    now = time.monotonic()
+    cached = getattr(state, "summarizer_health", None)
+    if cached is not None and now - cached[0] < HEALTH_CHECK_TTL:
+        return cached[1]
+
+    ready = await state.summarizer.health_check()
+    state.summarizer_health = (now, ready)
+    return ready
+
+
 @router.get("/health", response_model=HealthResponse)
-async def health(request: Request) -> HealthResponse:
+async def health(request: Request) -> Response:
     """Health check endpoint."""
-    pipeline = get_pipeline(request)
-    summarizer = request.app.state.summarizer
+    state = request.app.state
+    pipeline: AudioPipeline = state.audio_manager
 
     status = pipeline.get_status()
-    summarizer_ready = await summarizer.health_check()
-
-    return HealthResponse(
-        status="ok",
-        tts_ready=True,
-        summarizer_ready=summarizer_ready,
-        queue_depth=status.pending_requests + status.pending_messages + status.ready_audio,
+    queue_depth = status.pending_requests + status.pending_messages + status.ready_audio
+
+    if await summarizer_ready(state):
+        return Response(
+            _HEALTH_OK_PREFIX + str(queue_depth).encode() + b"}",
+            media_type="application/json",
+        )
+
+    return json_response(
+        HealthResponse.model_construct(
+            status="ok",
+            tts_ready=True,
+            summarizer_ready=False,
+            queue_depth=queue_depth,
+        )
     )
 
 
-@router.post("/summarize", response_model=MessageResponse)
-async def summarize(
-    request: Request,
-    body: SummarizeRequest,
-) -> MessageResponse:
+_SUMMARIZE_BODY = json_body(SummarizeRequest)
+_SUMMARIZE_BODY["requestBody"]["content"][NDJSON_MEDIA_TYPE] = {
+    "schema": {"type": "string", "description": "Claude Code transcript JSONL content"},
+}
+
+
+@router.post("/summarize", response_model=MessageResponse, openapi_extra=_SUMMARIZE_BODY)
+async def summarize(request: Request) -> Response:
     """Full summarization pipeline for Stop hook.
 
     Parses transcript and queues for summarization → TTS → playback.
     Returns immediately after queuing.
+
+    The transcript can be sent as the raw JSONL body (Content-Type
+    application/x-ndjson), which avoids JSON-escaping the whole transcript
+    into a string on the client and unescaping it here, or wrapped in a
+    JSON body as transcript_content.
     """
+    if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        # Parsed as bytes; the parser handles the UTF-8 itself
+        transcript_content = await request.body()
+    else:
+        transcript_content = (await read_body(request, SummarizeRequest)).transcript_content
     pipeline = get_pipeline(request)
 
     # Parse transcript content
-    if not body.transcript_content:
+    if not transcript_content:
         raise HTTPException(status_code=400, detail="transcript_content is required")
 
-    parsed = parse_transcript(body.transcript_content)
+    if len(transcript_content) >= PARSE_IN_THREAD_MIN_SIZE:
+        parsed = await asyncio.to_thread(parse_transcript, transcript_content)
+    else:
+        parsed = parse_transcript(transcript_content)
     if not parsed:
         raise HTTPException(status_code=400, detail="No content in transcript")
 
@@ -68,15 +178,16 @@ async def summarize(
     has_tool_calls = parsed.has_tool_calls
     content_length = parsed.length
     if parsed.truncated:
-        log.debug(f"Content truncated to {content_length} chars")
+        log.debug("Content truncated to %d chars", content_length)
 
-    log.info(f"POST /summarize ({content_length} chars)")
+    log.info("POST /summarize (%d chars)", content_length)
 
     # Determine summary type
-    if has_tool_calls or content_length >= 300:
-        summary_type = SummaryType.LONG_RESPONSE
-    else:
-        summary_type = SummaryType.SHORT_RESPONSE
+    summary_type = (
+        SummaryType.LONG_RESPONSE
+        if has_tool_calls or content_length >= LONG_RESPONSE_MIN_CHARS
+        else SummaryType.SHORT_RESPONSE
+    )
 
     # Queue for processing (returns immediately)
     request_id = await pipeline.add_request(
@@ -85,34 +196,29 @@ async def summarize(
         summary_type=summary_type,
     )
 
-    return MessageResponse(
-        message_id=request_id,
-        status="queued",
-    )
+    return queued_response(request_id)
 
 
-@router.post("/permission", response_model=MessageResponse)
-async def permission(
-    request: Request,
-    body: PermissionRequest,
-) -> MessageResponse:
+@router.post("/permission", response_model=MessageResponse, openapi_extra=json_body(PermissionRequest))
+async def permission(request: Request) -> Response:
     """Permission announcement pipeline for PermissionRequest hook.
 
     Queues for summarization → TTS → playback.
     Returns immediately after queuing.
     """
+    body = await read_body(request, PermissionRequest)
     pipeline = get_pipeline(request)
 
-    log.info(f"POST /permission tool={body.tool_name}")
-
-    # Build description for summarization
-    tool_input_str = json.dumps(body.tool_input)
-    description = body.tool_input.get("description", "")
+    log.info("POST /permission tool=%s", body.tool_name)
 
-    if description:
-        content = f"Tool: {body.tool_name}. Description: {description}. Input: {tool_input_str}"
-    else:
-        content = f"Tool: {body.tool_name}. Input: {tool_input_str}"
+    # Build description for summarization (compact JSON, as in the prompt examples)
+    tool_input_str = orjson.dumps(body.tool_input).decode()
+    description = body.tool_input.get("description")
+    content = (
+        f"Tool: {body.tool_name}. Description: {description}. Input: {tool_input_str}"
+        if description
+        else f"Tool: {body.tool_name}. Input: {tool_input_str}"
+    )
 
     # Queue for processing (returns immediately)
     request_id = await pipeline.add_request(
@@ -122,21 +228,16 @@ async def permission(
         metadata={"tool_name": body.tool_name},
     )
 
-    return MessageResponse(
-        message_id=request_id,
-        status="queued",
-    )
+    return queued_response(request_id)
 
 
-@router.post("/speak", response_model=MessageResponse)
-async def speak(
-    request: Request,
-    body: SpeakRequest,
-) -> MessageResponse:
+@router.post("/speak", response_model=MessageResponse, openapi_extra=json_body(SpeakRequest))
+async def speak(request: Request) -> Response:
     """Direct TTS - skip summarization, just speak the text."""
+    body = await read_body(request, SpeakRequest)
     pipeline = get_pipeline(request)
 
-    log.info(f"POST /speak ({len(body.text)} chars)")
+    log.info("POST /speak (%d chars)", len(body.text))
 
     if not body.text.strip():
         raise HTTPException(status_code=400, detail="Text cannot be empty")
@@ -144,40 +245,39 @@ async def speak(
     # Queue directly for TTS (skip summarization)
     message_id = await pipeline.add_message(body.text)
 
-    return MessageResponse(
-        message_id=message_id,
-        status="queued",
-    )
+    return queued_response(message_id)
 
 
 @router.get("/queue", response_model=QueueStatusResponse)
-async def get_queue_status(request: Request) -> QueueStatusResponse:
+async def get_queue_status(request: Request) -> Response:
     """Get current queue status."""
     pipeline = get_pipeline(request)
     status = pipeline.get_status()
 
-    return QueueStatusResponse(
-        pending_requests=status.pending_requests,
-        pending_messages=status.pending_messages,
-        ready_audio=status.ready_audio,
-        is_playing=status.is_playing,
-        current_text=status.current_text,
+    return json_response(
+        QueueStatusResponse.model_construct(
+            pending_requests=status.pending_requests,
+            pending_messages=status.pending_messages,
+            ready_audio=status.ready_audio,
+            is_playing=status.is_playing,
+            current_text=status.current_text,
+        )
     )
 
 
 @router.post("/queue/clear")
-async def clear_queue(request: Request) -> dict:
+async def clear_queue(request: Request) -> Response:
     """Clear all pending and ready audio."""
     pipeline = get_pipeline(request)
     count = await pipeline.clear_queue()
 
-    return {"cleared": count, "status": "ok"}
+    return Response(_CLEARED_PREFIX + str(count).encode() + _OK_SUFFIX, media_type="application/json")
 
 
 @router.post("/queue/skip")
-async def skip_current(request: Request) -> dict:
+async def skip_current(request: Request) -> Response:
     """Skip currently playing audio."""
     pipeline = get_pipeline(request)
     skipped = await pipeline.skip_current()
 
-    return {"skipped": skipped, "status": "ok"}
+    return Response(_SKIPPED_BODIES[skipped], media_type="application/json")
@@ -2,16 +2,19 @@
 
 from typing import Literal
 
+from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ENV_FILE = ".env"
+
 
 class TTSConfig(BaseSettings):
     """TTS backend configuration."""
 
     model_config = SettingsConfigDict(
         env_prefix="TTS_",
-        env_file=".env",
+        env_file=ENV_FILE,
         populate_by_name=True,
         extra="ignore",
     )
@@ -40,7 +43,7 @@ class SummarizerConfig(BaseSettings):
 
     model_config = SettingsConfigDict(
         env_prefix="SUMMARY_",
-        env_file=".env",
+        env_file=ENV_FILE,
         populate_by_name=True,
         extra="ignore",
     )
@@ -67,7 +70,7 @@ class SummarizerConfig(BaseSettings):
 class AudioConfig(BaseSettings):
     """Audio playback configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="AUDIO_", env_file=".env", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="AUDIO_", env_file=ENV_FILE, extra="ignore")
 
     interrupt: bool = True
     min_duration: float = 1.5
@@ -84,7 +87,7 @@ class ServerConfig(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="TTS_SERVER_",
         env_nested_delimiter="__",
-        env_file=".env",
+        env_file=ENV_FILE,
         populate_by_name=True,
         extra="ignore",
     )
@@ -92,6 +95,8 @@ class ServerConfig(BaseSettings):
     host: str = "127.0.0.1"
     port: int = Field(default=20202, alias="SUMMARY_AUDIO_PORT")
     log_level: Literal["TRACE", "DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    # Connections + in-flight requests before new ones get 503 (bounds memory)
+    max_connections: int = Field(default=64, ge=1)
 
     tts: TTSConfig = Field(default_factory=TTSConfig)
     summarizer: SummarizerConfig = Field(default_factory=SummarizerConfig)
@@ -99,31 +104,65 @@ class ServerConfig(BaseSettings):
 
     @classmethod
     def from_cli_args(cls, **kwargs) -> "ServerConfig":
-        """Create config from CLI arguments, merged with env vars."""
-        # Filter out None values (unset CLI args)
-        cli_args = {k: v for k, v in kwargs.items() if v is not None}
-
-        # Map CLI args to nested config
-        tts_args = {}
-        summarizer_args = {}
-        audio_args = {}
-        server_args = {}
-
-        for key, value in cli_args.items():
-            if key in ("voice", "lang"):
-                tts_args[key] = value
-            elif key in ("summarizer_backend",):
-                summarizer_args["backend"] = value
-            elif key in ("interrupt", "min_duration", "queue", "max_queue",
-                        "interrupt_chime", "drop_sound"):
-                # Convert CLI naming to config naming
-                audio_args[key.replace("-", "_")] = value
-            elif key in ("host", "port", "log_level"):
-                server_args[key] = value
-
-        # Create nested configs with CLI overrides
-        tts = TTSConfig(**tts_args) if tts_args else TTSConfig()
-        summarizer = SummarizerConfig(**summarizer_args) if summarizer_args else SummarizerConfig()
-        audio = AudioConfig(**audio_args) if audio_args else AudioConfig()
-
-        return cls(tts=tts, summarizer=summarizer, audio=audio, **server_args)
+        """Create config from CLI arguments, merged with env vars.
+
+        Keyword names are the CLI option names (see _CLI_ROUTES); None
+        values mean the option was not given and the env/default is used.
+
+        The .env file is parsed once into the process environment (existing
+        env vars take precedence, as with env_file) rather than re-read by
+        each settings class. Side effect: its variables stay in os.environ
+        for the rest of the process, so call this once at CLI entry, not
+        where a config is built for a scoped use (tests should isolate
+        os.environ).
+        """
+        load_dotenv(ENV_FILE, override=False)
+
+        overrides: dict[str | None, dict] = {None: {}, **{name: {} for name in _SECTIONS}}
+        for key, value in kwargs.items():
+            if value is None:
+                continue
+            try:
+                section, field = _CLI_ROUTES[key]
+            except KeyError:
+                raise TypeError(f"Unknown CLI argument: {key}") from None
+            overrides[section][field] = value
+
+        sections = {
+            name: config_cls(_env_file=None, **overrides[name])
+            for name, config_cls in _SECTIONS.items()
+        }
+        return cls(_env_file=None, **sections, **overrides[None])
+
+
+# Nested config sections of ServerConfig
+_SECTIONS: dict[str, type[BaseSettings]] = {
+    "tts": TTSConfig,
+    "summarizer": SummarizerConfig,
+    "audio": AudioConfig,
+}
+
+# CLI option name -> (section, field); section None is ServerConfig itself
+_CLI_ROUTES: dict[str, tuple[str | None, str]] = {
+    "host": (None, "host"),
+    "port": (None, "port"),
+    "log_level": (None, "log_level"),
+    "tts": ("tts", "backend"),
+    "kokoro_voice": ("tts", "kokoro_voice"),
+    "kokoro_lang": ("tts", "kokoro_lang"),
+    "tts_groq_voice": ("tts", "groq_voice"),
+    "tts_groq_model": ("tts", "groq_model"),
+    "elevenlabs_voice": ("tts", "elevenlabs_voice"),
+    "elevenlabs_model": ("tts", "elevenlabs_model"),
+    "summarizer": ("summarizer", "backend"),
+    "ollama_model_large": ("summarizer", "ollama_model_large"),
+    "ollama_model_small": ("summarizer", "ollama_model_small"),
+    "ollama_url": ("summarizer", "ollama_url"),
+    "interrupt": ("audio", "interrupt"),
+    "min_duration": ("audio", "min_duration"),
+    "queue": ("audio", "queue"),
+    "max_queue": ("audio", "max_queue"),
+    "interrupt_chime": ("audio", "interrupt_chime"),
+    "drop_sound": ("audio", "drop_sound"),
+    "speed": ("audio", "speed"),
+}
@@ -1,11 +1,11 @@
 """Audio pipeline with async workers for summarization, TTS generation, and playback."""
 
 import asyncio
+import itertools
 import logging
-import os
 import time
-import uuid
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -13,12 +13,16 @@ from pathlib import Path
 from ..config import AudioConfig
 from ..summarizers.base import SummarizerInterface, SummaryRequest, SummaryType
 from ..tts.base import TTSInterface
-from .context import get_request_id, sanitize_for_log, set_request_id
+from .context import SanitizedText, get_request_id, request_id_var, set_request_id
 from .playback import AudioPlayer
 from .sounds import SoundManager, save_audio
 
 log = logging.getLogger("tts-server")
 
+# IDs for requests and messages. They are only compared within this process
+# (and shared, so API message_ids stay unique), so a counter suffices.
+_item_ids = itertools.count(1)
+
 
 class RequestType(Enum):
     """Type of request for the pipeline."""
@@ -28,11 +32,11 @@ class RequestType(Enum):
     SPEAK = "speak"  # Direct TTS, skip summarization
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingRequest:
     """A request waiting to be processed."""
 
-    id: str
+    id: int
     request_id: str | None  # For logging correlation
     request_type: RequestType
     content: str
@@ -49,7 +53,7 @@ class PendingRequest:
     ) -> "PendingRequest":
         """Create a new request with generated ID and current request context."""
         return cls(
-            id=str(uuid.uuid4()),
+            id=next(_item_ids),
             request_id=get_request_id(),
             request_type=request_type,
             content=content,
@@ -58,11 +62,11 @@ class PendingRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingMessage:
     """A message waiting to be converted to speech."""
 
-    id: str
+    id: int
     request_id: str | None
     text: str
     timestamp: float
@@ -71,24 +75,24 @@ class PendingMessage:
     def create(cls, text: str, request_id: str | None = None) -> "PendingMessage":
         """Create a new message with generated ID and current timestamp."""
         return cls(
-            id=str(uuid.uuid4()),
+            id=next(_item_ids),
             request_id=request_id,
             text=text,
             timestamp=time.time(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadyAudio:
     """Audio that has been generated and is ready to play."""
 
-    id: str
+    id: int
     request_id: str | None
     audio_file: Path
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueStatus:
     """Status of the audio pipeline."""
 
@@ -99,6 +103,31 @@ class QueueStatus:
     current_text: str | None = None
 
 
+def _unlink(path: Path | None) -> None:
+    """Delete a generated audio file, ignoring one that is missing or already gone."""
+    if path is None:
+        return
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        log.debug("Could not delete %s: %s", path, e)
+
+
+def _unlink_all(paths: list[Path]) -> None:
+    """Delete generated audio files."""
+    for path in paths:
+        _unlink(path)
+
+
+def _retrieve_summary_error(task: asyncio.Task) -> None:
+    """Retrieve a summary task's exception, so a discarded one isn't reported as never retrieved.
+
+    Failures of awaited summaries are logged by the summarizer worker.
+    """
+    if not task.cancelled() and (e := task.exception()) is not None:
+        log.debug("Summary task failed: %s", e)
+
+
 class AudioPipeline:
     """Manages the full audio pipeline: summarization → TTS → playback."""
 
@@ -112,26 +141,36 @@ class AudioPipeline:
         self.tts = tts
         self.summarizer = summarizer
 
-        # Pipeline queues
-        self.pending_requests: deque[PendingRequest] = deque()
-        self.pending_messages: deque[PendingMessage] = deque()
+        # Pipeline queues (workers block on get(), no polling)
+        self.pending_requests: asyncio.Queue[PendingRequest] = asyncio.Queue(config.max_queue)
+        self.pending_messages: asyncio.Queue[PendingMessage] = asyncio.Queue(config.max_queue)
         self.ready_audio: deque[ReadyAudio] = deque()
 
-        # Locks for queue access
-        self.requests_lock = asyncio.Lock()
-        self.messages_lock = asyncio.Lock()
-        self.audio_lock = asyncio.Lock()
+        # Items taken off a queue and still being worked on. Dropping or
+        # clearing resets these, so the worker discards its stale result.
+        self._active_request: PendingRequest | None = None
+        self._prefetched_request: PendingRequest | None = None
+        self._active_message: PendingMessage | None = None
 
-        # Playback
-        self.player = AudioPlayer()
-        self.sounds = SoundManager(tts.get_sample_rate())
-        self._current_text: str | None = None
+        # ready_audio needs no lock: every read-modify-write of it is
+        # await-free, so it runs atomically on the event loop. Keep it that way.
+
+        # Backends with native speed control synthesize at speed; otherwise
+        # save_audio time-stretches
+        self._stretch_speed = 1.0 if tts.supports_speed else config.speed
+
+        # Audio file writes and deletes (rubberband + WAV encode) run off the event loop
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-io")
 
         # Control events
         self.shutdown_event = asyncio.Event()
-        self.new_request_event = asyncio.Event()
-        self.new_message_event = asyncio.Event()
-        self.audio_ready_event = asyncio.Event()
+        # Set when audio becomes ready or playback finishes; wakes the playback worker
+        self.playback_event = asyncio.Event()
+
+        # Playback
+        self.player = AudioPlayer(on_finished=self.playback_event.set)
+        self.sounds = SoundManager(tts.get_sample_rate())
+        self._current_text: str | None = None
 
         # Worker tasks
         self._summarizer_task: asyncio.Task | None = None
@@ -150,27 +189,25 @@ class AudioPipeline:
         """Stop workers and cleanup."""
         self.shutdown_event.set()
 
-        # Cancel tasks
-        for task in [self._summarizer_task, self._generator_task, self._playback_task]:
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        # Cancel all workers, then wait for them together
+        tasks = [
+            task
+            for task in (self._summarizer_task, self._generator_task, self._playback_task)
+            if task
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         # Stop playback and cleanup
-        self.player.stop()
+        await self.player.stop()
         self.sounds.cleanup()
 
         # Clean up any remaining audio files
-        async with self.audio_lock:
-            for audio in self.ready_audio:
-                try:
-                    os.unlink(audio.audio_file)
-                except OSError:
-                    pass
-            self.ready_audio.clear()
+        audio_files = [audio.audio_file for audio in self.ready_audio]
+        self.ready_audio.clear()
+        await asyncio.get_running_loop().run_in_executor(self._io_executor, _unlink_all, audio_files)
+        self._io_executor.shutdown(wait=False)
 
         log.debug("Audio pipeline stopped")
 
@@ -180,7 +217,7 @@ class AudioPipeline:
         content: str,
         summary_type: SummaryType | None = None,
         metadata: dict | None = None,
-    ) -> str:
+    ) -> int:
         """Add a new request to the pipeline.
 
         Args:
@@ -194,26 +231,31 @@ class AudioPipeline:
         """
         req = PendingRequest.create(request_type, content, summary_type, metadata)
 
-        async with self.requests_lock:
-            if self.config.queue:
-                # Queue mode: add to queue, drop oldest if over limit
-                while len(self.pending_requests) >= self.config.max_queue:
-                    dropped = self.pending_requests.popleft()
-                    log.warning(f"Queue full, dropped request: {sanitize_for_log(dropped.content, 50)}")
-                    self._play_drop_sound()
-                self.pending_requests.append(req)
-            else:
-                # No-queue mode: replace all pending with latest
-                while self.pending_requests:
-                    dropped = self.pending_requests.popleft()
-                    log.warning(f"Dropped request (latest-only): {sanitize_for_log(dropped.content, 50)}")
-                    self._play_drop_sound()
-                self.pending_requests.append(req)
-
-        self.new_request_event.set()
+        dropped: list[str] = []
+        if self.config.queue:
+            # Queue mode: add to queue, drop oldest if over limit. A request
+            # being summarized ahead has left the queue but is still waiting
+            # (and is the oldest), so it counts against max_queue.
+            prefetched = self._prefetched_request
+            if prefetched and self.pending_requests.qsize() + 1 >= self.config.max_queue:
+                dropped.append(prefetched.content)
+                self._prefetched_request = None
+            while self.pending_requests.full():
+                dropped.append(self.pending_requests.get_nowait().content)
+            self._dropped("Queue full, dropped request", dropped)
+        else:
+            # No-queue mode: replace all pending (and in-progress) with latest
+            if self._active_request is not None:
+                dropped.append(self._active_request.content)
+                self._active_request = None
+            while not self.pending_requests.empty():
+                dropped.append(self.pending_requests.get_nowait().content)
+            self._dropped("Dropped request (latest-only)", dropped)
+
+        self.pending_requests.put_nowait(req)
         return req.id
 
-    async def add_message(self, text: str) -> str:
+    async def add_message(self, text: str) -> int:
         """Add a message directly to TTS queue (skip summarization).
 
         Args:
@@ -223,29 +265,18 @@ class AudioPipeline:
             The message ID.
         """
         msg = PendingMessage.create(text, request_id=get_request_id())
-
-        async with self.messages_lock:
-            if self.config.queue:
-                while len(self.pending_messages) >= self.config.max_queue:
-                    dropped = self.pending_messages.popleft()
-                    log.warning(f"Queue full, dropped message: {sanitize_for_log(dropped.text, 50)}")
-                    self._play_drop_sound()
-                self.pending_messages.append(msg)
-            else:
-                while self.pending_messages:
-                    dropped = self.pending_messages.popleft()
-                    log.warning(f"Dropped message (latest-only): {sanitize_for_log(dropped.text, 50)}")
-                    self._play_drop_sound()
-                self.pending_messages.append(msg)
-
-        self.new_message_event.set()
+        self._push_message(msg)
         return msg.id
 
     def get_status(self) -> QueueStatus:
         """Get current pipeline status."""
         return QueueStatus(
-            pending_requests=len(self.pending_requests),
-            pending_messages=len(self.pending_messages),
+            pending_requests=(
+                self.pending_requests.qsize()
+                + (self._active_request is not None)
+                + (self._prefetched_request is not None)
+            ),
+            pending_messages=self.pending_messages.qsize() + (self._active_message is not None),
             ready_audio=len(self.ready_audio),
             is_playing=self.player.is_playing(),
             current_text=self._current_text,
@@ -259,24 +290,27 @@ class AudioPipeline:
         """
         count = 0
 
-        async with self.requests_lock:
-            count += len(self.pending_requests)
-            self.pending_requests.clear()
+        for queue in (self.pending_requests, self.pending_messages):
+            while not queue.empty():
+                queue.get_nowait()
+                count += 1
 
-        async with self.messages_lock:
-            count += len(self.pending_messages)
-            self.pending_messages.clear()
+        # In-progress items are discarded by their worker once it finishes
+        count += (
+            (self._active_request is not None)
+            + (self._prefetched_request is not None)
+            + (self._active_message is not None)
+        )
+        self._active_request = None
+        self._prefetched_request = None
+        self._active_message = None
 
-        async with self.audio_lock:
-            for audio in self.ready_audio:
-                try:
-                    os.unlink(audio.audio_file)
-                except OSError:
-                    pass
-            count += len(self.ready_audio)
-            self.ready_audio.clear()
+        audio_files = [audio.audio_file for audio in self.ready_audio]
+        self.ready_audio.clear()
+        count += len(audio_files)
+        await asyncio.get_running_loop().run_in_executor(self._io_executor, _unlink_all, audio_files)
 
-        log.debug(f"Cleared {count} items from pipeline")
+        log.debug("Cleared %d items from pipeline", count)
         return count
 
     async def skip_current(self) -> bool:
@@ -286,249 +320,262 @@ class AudioPipeline:
             True if something was skipped, False otherwise.
         """
         if self.player.is_playing():
-            audio_file = self.player.stop()
-            if audio_file:
-                try:
-                    os.unlink(audio_file)
-                except OSError:
-                    pass
+            audio_file = await self.player.stop()
+            _unlink(audio_file)
             self._current_text = None
             log.debug("Skipped current audio")
             return True
         return False
 
+    def _push_message(self, msg: PendingMessage) -> None:
+        """Queue a message for TTS, dropping displaced messages per queue mode."""
+        dropped: list[str] = []
+        if self.config.queue:
+            while self.pending_messages.full():
+                dropped.append(self.pending_messages.get_nowait().text)
+            self._dropped("Queue full, dropped message", dropped)
+        else:
+            if self._active_message is not None:
+                dropped.append(self._active_message.text)
+                self._active_message = None
+            while not self.pending_messages.empty():
+                dropped.append(self.pending_messages.get_nowait().text)
+            self._dropped("Dropped message (latest-only)", dropped)
+
+        self.pending_messages.put_nowait(msg)
+
+    def _dropped(self, reason: str, texts: list[str]) -> None:
+        """Report items displaced by one queue operation, with a single drop sound."""
+        if not texts:
+            return
+        if len(texts) == 1:
+            log.warning("%s: %s", reason, SanitizedText(texts[0], 50))
+        else:
+            log.warning(
+                "%s: %s (and %d older)", reason, SanitizedText(texts[-1], 50), len(texts) - 1
+            )
+        self._play_drop_sound()
+
     def _play_drop_sound(self) -> None:
         """Play drop sound if enabled."""
         if self.config.drop_sound:
             self.player.play_drop_sound(self.sounds.drop_file)
 
-    async def _summarizer_worker(self) -> None:
-        """Process requests: summarize and push to message queue."""
-        log.debug("Summarizer worker started")
+    def _start_summary(self, req: PendingRequest) -> asyncio.Task | None:
+        """Start summarizing a request in the background (None for SPEAK)."""
+        if req.request_type == RequestType.SPEAK:
+            return None
+
+        # Set around create_task so the task's context logs this request's ID,
+        # then restore the caller's (a prefetch runs while another is current)
+        token = request_id_var.set(req.request_id)
+        try:
+            log.debug("Summarization start (%d chars)", len(req.content))
+            task = asyncio.create_task(
+                self.summarizer.summarize(
+                    SummaryRequest(
+                        content=req.content,
+                        summary_type=req.summary_type or SummaryType.SHORT_RESPONSE,
+                        metadata=req.metadata,
+                    )
+                )
+            )
+        finally:
+            request_id_var.reset(token)
+        task.add_done_callback(_retrieve_summary_error)
+        return task
 
-        while not self.shutdown_event.is_set():
-            # Wait for requests
-            try:
-                await asyncio.wait_for(self.new_request_event.wait(), timeout=0.5)
-            except asyncio.TimeoutError:
-                continue
-
-            self.new_request_event.clear()
+    async def _summarizer_worker(self) -> None:
+        """Process requests: summarize and push to message queue.
 
-            while True:
-                # Get next request
-                async with self.requests_lock:
-                    if not self.pending_requests:
-                        break
+        In queue mode the next request's summary is started while the current
+        one is awaited, so back-to-back requests overlap one summarizer
+        round-trip. Results are still published in queue order. That request
+        counts against max_queue, so at most max_queue requests wait besides
+        the active one.
+        """
+        log.debug("Summarizer worker started")
+        prefetched: tuple[PendingRequest, asyncio.Task | None] | None = None
+
+        try:
+            while not self.shutdown_event.is_set():
+                if prefetched:
+                    req, summary = prefetched
+                    prefetched = None
+                    if self._prefetched_request is not req:
+                        # Cleared while being summarized ahead
+                        if summary:
+                            summary.cancel()
+                        log.warning(
+                            "Discarded (no longer relevant): %s", SanitizedText(req.content, 50)
+                        )
+                        continue
+                    self._prefetched_request = None
+                else:
+                    req = await self.pending_requests.get()
+                    summary = self._start_summary(req)
+                self._active_request = req
 
-                    if self.config.queue:
-                        req = self.pending_requests[0]
-                    else:
-                        # No-queue mode: process latest only
-                        while len(self.pending_requests) > 1:
-                            dropped = self.pending_requests.popleft()
-                            log.warning(f"Dropped request (processing latest): {sanitize_for_log(dropped.content, 50)}")
-                            self._play_drop_sound()
-                        req = self.pending_requests[0]
+                if self.config.queue and summary and not self.pending_requests.empty():
+                    next_req = self.pending_requests.get_nowait()
+                    self._prefetched_request = next_req
+                    prefetched = (next_req, self._start_summary(next_req))
 
                 # Set request ID for logging
                 if req.request_id:
                     set_request_id(req.request_id)
 
-                # Process based on request type
-                if req.request_type == RequestType.SPEAK:
+                if summary is None:
                     # Direct TTS - no summarization needed
                     text = req.content
-                    log.debug(f"Speak request ({len(text)} chars)")
+                    log.debug("Speak request (%d chars)", len(text))
                 else:
-                    # Summarize the content
-                    log.debug(f"Summarization start ({len(req.content)} chars)")
                     try:
-                        result = await self.summarizer.summarize(
-                            SummaryRequest(
-                                content=req.content,
-                                summary_type=req.summary_type or SummaryType.SHORT_RESPONSE,
-                                metadata=req.metadata,
-                            )
+                        text = (await summary).text
+                        log.debug(
+                            "Summarization end (%d chars): %s", len(text), SanitizedText(text)
                         )
-                        text = result.text
-                        log.debug(f"Summarization end ({len(text)} chars): {sanitize_for_log(text)}")
                     except Exception as e:
-                        log.error(f"Summarization failed: {e}")
-                        # Remove failed request and continue
-                        async with self.requests_lock:
-                            if self.pending_requests and self.pending_requests[0].id == req.id:
-                                self.pending_requests.popleft()
+                        log.error("Summarization failed: %s", e)
+                        if self._active_request is req:
+                            self._active_request = None
                         continue
 
                 # Check if request is still relevant
-                async with self.requests_lock:
-                    if not self.pending_requests or self.pending_requests[0].id != req.id:
-                        log.warning(f"Discarded (no longer relevant): {sanitize_for_log(req.content, 50)}")
-                        continue
-                    self.pending_requests.popleft()
+                if self._active_request is not req:
+                    log.warning(
+                        "Discarded (no longer relevant): %s", SanitizedText(req.content, 50)
+                    )
+                    continue
+                self._active_request = None
 
                 # Push to message queue
-                msg = PendingMessage.create(text, request_id=req.request_id)
-
-                async with self.messages_lock:
-                    if self.config.queue:
-                        self.pending_messages.append(msg)
-                    else:
-                        while self.pending_messages:
-                            dropped = self.pending_messages.popleft()
-                            log.warning(f"Dropped message (latest-only): {sanitize_for_log(dropped.text, 50)}")
-                            self._play_drop_sound()
-                        self.pending_messages.append(msg)
-
-                self.new_message_event.set()
+                self._push_message(PendingMessage.create(text, request_id=req.request_id))
+        finally:
+            if prefetched and prefetched[1]:
+                prefetched[1].cancel()
 
     async def _generator_worker(self) -> None:
         """Generate audio for pending messages."""
         log.debug("Generator worker started")
 
         while not self.shutdown_event.is_set():
-            # Wait for messages
-            try:
-                await asyncio.wait_for(self.new_message_event.wait(), timeout=0.5)
-            except asyncio.TimeoutError:
-                continue
-
-            self.new_message_event.clear()
+            msg = await self.pending_messages.get()
+            self._active_message = msg
 
-            while True:
-                # Get next message
-                async with self.messages_lock:
-                    if not self.pending_messages:
-                        break
+            # Set request ID for logging
+            if msg.request_id:
+                set_request_id(msg.request_id)
 
-                    if self.config.queue:
-                        msg = self.pending_messages[0]
-                    else:
-                        while len(self.pending_messages) > 1:
-                            dropped = self.pending_messages.popleft()
-                            log.warning(f"Dropped message (generating latest): {sanitize_for_log(dropped.text, 50)}")
-                            self._play_drop_sound()
-                        msg = self.pending_messages[0]
+            log.debug(
+                "Audio generation start (%d chars): %s", len(msg.text), SanitizedText(msg.text)
+            )
 
-                # Set request ID for logging
-                if msg.request_id:
-                    set_request_id(msg.request_id)
+            # Generate audio
+            audio = await self.tts.synthesize(msg.text, speed=self.config.speed)
 
-                log.debug(f"Audio generation start ({len(msg.text)} chars): {sanitize_for_log(msg.text)}")
+            if audio is None or len(audio) == 0:
+                log.warning("Generation produced no audio")
+                if self._active_message is msg:
+                    self._active_message = None
+                continue
 
-                # Generate audio
-                audio = await self.tts.synthesize(msg.text)
+            # Check if message is still relevant
+            if self._active_message is not msg:
+                log.warning("Discarded (no longer relevant): %s", SanitizedText(msg.text, 50))
+                continue
 
-                if audio is None or len(audio) == 0:
-                    log.warning("Generation produced no audio")
-                    async with self.messages_lock:
-                        if self.pending_messages and self.pending_messages[0].id == msg.id:
-                            self.pending_messages.popleft()
-                    continue
+            # Save audio, still active so a clear or replacement can drop it
+            audio_file = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor, save_audio, audio, self.tts.get_sample_rate(), self._stretch_speed
+            )
+            if self._active_message is not msg:
+                log.warning("Discarded (no longer relevant): %s", SanitizedText(msg.text, 50))
+                _unlink(audio_file)
+                continue
+            self._active_message = None
 
-                # Check if message is still relevant
-                async with self.messages_lock:
-                    if not self.pending_messages or self.pending_messages[0].id != msg.id:
-                        log.warning(f"Discarded (no longer relevant): {sanitize_for_log(msg.text, 50)}")
-                        continue
-                    self.pending_messages.popleft()
-
-                # Save audio and add to ready queue
-                audio_file = save_audio(audio, self.tts.get_sample_rate(), self.config.speed)
-
-                async with self.audio_lock:
-                    ready = ReadyAudio(msg.id, msg.request_id, audio_file, msg.text)
-                    if self.config.queue:
-                        self.ready_audio.append(ready)
-                    else:
-                        while self.ready_audio:
-                            old = self.ready_audio.popleft()
-                            log.warning(f"Dropped ready audio: {sanitize_for_log(old.text, 50)}")
-                            self._play_drop_sound()
-                            try:
-                                os.unlink(old.audio_file)
-                            except OSError:
-                                pass
-                        self.ready_audio.append(ready)
-
-                log.debug(f"Audio generation end: {sanitize_for_log(msg.text, 50)}")
-                self.audio_ready_event.set()
+            # Add to ready queue
+            ready = ReadyAudio(msg.id, msg.request_id, audio_file, msg.text)
+            if self.config.queue:
+                self.ready_audio.append(ready)
+            else:
+                stale = list(self.ready_audio)
+                self.ready_audio.clear()
+                self.ready_audio.append(ready)
+                self._dropped("Dropped ready audio", [old.text for old in stale])
+                for old in stale:
+                    _unlink(old.audio_file)
+
+            log.debug("Audio generation end: %s", SanitizedText(msg.text, 50))
+            self.playback_event.set()
+
+    async def _wait_playback_event(self, timeout: float | None = None) -> None:
+        """Wait until audio is ready, playback finishes, or the timeout passes."""
+        try:
+            await asyncio.wait_for(self.playback_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
     async def _playback_worker(self) -> None:
         """Play ready audio with interrupt handling."""
         log.debug("Playback worker started")
 
         while not self.shutdown_event.is_set():
-            # Check for ready audio
-            try:
-                await asyncio.wait_for(self.audio_ready_event.wait(), timeout=0.1)
-                self.audio_ready_event.clear()
-            except asyncio.TimeoutError:
-                pass
+            # Clear before checking state, so a change during the checks
+            # makes the next wait return immediately
+            self.playback_event.clear()
 
             # Check if current audio finished
             finished_file = self.player.check_finished()
             if finished_file:
                 log.debug("Audio end")
                 self._current_text = None
-                try:
-                    os.unlink(finished_file)
-                except OSError:
-                    pass
+                _unlink(finished_file)
 
             # Get next ready audio
-            async with self.audio_lock:
-                if not self.ready_audio:
-                    continue
-                next_audio = self.ready_audio[0]
+            if not self.ready_audio:
+                await self._wait_playback_event()
+                continue
 
             # Handle based on current playback state
             if self.player.is_playing():
                 if not self.config.interrupt:
+                    await self._wait_playback_event()
                     continue
 
                 elapsed = self.player.get_elapsed_time()
                 if elapsed is not None and elapsed < self.config.min_duration:
-                    await asyncio.sleep(0.05)
+                    await self._wait_playback_event(self.config.min_duration - elapsed)
                     continue
 
                 # Interrupt current audio
                 log.debug("Interrupting current audio")
-                audio_file = self.player.stop()
+                _unlink(await self.player.stop())
                 self._current_text = None
-                if audio_file:
-                    try:
-                        os.unlink(audio_file)
-                    except OSError:
-                        pass
 
                 if self.config.interrupt_chime:
                     await self.player.play_chime(self.sounds.chime_file)
 
             # Pop from ready queue and play
-            async with self.audio_lock:
-                if not self.ready_audio:
-                    continue
-                next_audio = self.ready_audio.popleft()
+            if not self.ready_audio:
+                continue
+            next_audio = self.ready_audio.popleft()
 
             # Set request ID for logging
             if next_audio.request_id:
                 set_request_id(next_audio.request_id)
 
-            log.info(f"Playing: {sanitize_for_log(next_audio.text)}")
+            log.info("Playing: %s", SanitizedText(next_audio.text))
 
-            if self.player.play(next_audio.audio_file):
+            if await self.player.play(next_audio.audio_file):
                 self._current_text = next_audio.text
                 log.debug("Audio start")
+            else:
+                _unlink(next_audio.audio_file)
 
         # Cleanup on shutdown
-        audio_file = self.player.stop()
-        if audio_file:
-            try:
-                os.unlink(audio_file)
-            except OSError:
-                pass
+        _unlink(await self.player.stop())
 
 
 # Backwards compatibility alias
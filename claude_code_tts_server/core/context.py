@@ -19,6 +19,24 @@ def sanitize_for_log(text: str, max_len: int = 80) -> str:
         return text[:max_len] + "..."
     return text
 
+
+class SanitizedText:
+    """Lazy sanitize_for_log() for %-style log arguments.
+
+    Sanitizing only happens if the record is actually emitted, so debug
+    logging of message text costs nothing at INFO level.
+    """
+
+    __slots__ = ("text", "max_len")
+
+    def __init__(self, text: str, max_len: int = 80):
+        self.text = text
+        self.max_len = max_len
+
+    def __str__(self) -> str:
+        return sanitize_for_log(self.text, self.max_len)
+
+
 # Context variable for request ID
 request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
 
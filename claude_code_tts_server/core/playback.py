@@ -1,17 +1,23 @@
 """Audio playback utilities."""
 
 import asyncio
+import functools
 import logging
-import subprocess
+import shutil
 import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
 
 log = logging.getLogger("tts-server")
 
 
+@functools.cache
 def get_player() -> list[str] | None:
     """Get audio player command for this platform.
 
+    Detected once per process; callers must not mutate the returned list.
+
     Returns:
         List of command arguments for the audio player, or None if not found.
     """
@@ -19,56 +25,59 @@ def get_player() -> list[str] | None:
         return ["afplay"]
 
     for player in [["mpv", "--no-terminal"], ["paplay"], ["aplay"]]:
-        try:
-            result = subprocess.run(
-                ["which", player[0]], capture_output=True, check=False
-            )
-            if result.returncode == 0:
-                return player
-        except OSError:
-            pass
+        if shutil.which(player[0]):
+            return player
     return None
 
 
-def play_sound_async(audio_file: Path | str) -> subprocess.Popen | None:
-    """Play sound without blocking (fire-and-forget).
+async def play_sound_async(audio_file: Path | str) -> asyncio.subprocess.Process | None:
+    """Play sound without waiting for it to finish (fire-and-forget).
 
     Args:
         audio_file: Path to the audio file to play.
 
     Returns:
-        The subprocess, or None if playback failed.
+        The player process, or None if playback failed.
     """
     player = get_player()
     if player and audio_file:
-        return subprocess.Popen(
-            player + [str(audio_file)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+        return await asyncio.create_subprocess_exec(
+            *player,
+            str(audio_file),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
     return None
 
 
 class AudioPlayer:
-    """Manages audio playback with interrupt support."""
+    """Manages audio playback with interrupt support.
+
+    Playback state comes from a future that completes when the player
+    process exits, so checking it never polls the process. on_finished, if
+    given, is called on the event loop whenever a player process started by
+    play() exits (finished, stopped, or failed).
+    """
 
-    def __init__(self):
-        self.current_process: subprocess.Popen | None = None
+    def __init__(self, on_finished: Callable[[], None] | None = None):
+        self.current_process: asyncio.subprocess.Process | None = None
         self.play_start_time: float | None = None
         self._current_audio_file: Path | None = None
+        self._exited: asyncio.Future | None = None
+        self._on_finished = on_finished
+        self._sound_tasks: set[asyncio.Task] = set()
 
     def is_playing(self) -> bool:
         """Check if audio is currently playing."""
-        return self.current_process is not None and self.current_process.poll() is None
+        return self._exited is not None and not self._exited.done()
 
     def get_elapsed_time(self) -> float | None:
         """Get time elapsed since playback started."""
         if self.play_start_time is None:
             return None
-        import time
         return time.monotonic() - self.play_start_time
 
-    def play(self, audio_file: Path) -> bool:
+    async def play(self, audio_file: Path) -> bool:
         """Start playing an audio file.
 
         Args:
@@ -77,22 +86,26 @@ class AudioPlayer:
         Returns:
             True if playback started, False otherwise.
         """
-        import time
-
         player = get_player()
         if not player:
             return False
 
-        self.current_process = subprocess.Popen(
-            player + [str(audio_file)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+        self.current_process = await asyncio.create_subprocess_exec(
+            *player,
+            str(audio_file),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
         self.play_start_time = time.monotonic()
         self._current_audio_file = audio_file
+
+        # The event loop's child watcher completes this when the player exits
+        self._exited = asyncio.ensure_future(self.current_process.wait())
+        if self._on_finished:
+            self._exited.add_done_callback(lambda _: self._on_finished())
         return True
 
-    def stop(self) -> Path | None:
+    async def stop(self) -> Path | None:
         """Stop currently playing audio.
 
         Returns:
@@ -100,16 +113,20 @@ class AudioPlayer:
         """
         audio_file = self._current_audio_file
 
-        if self.current_process and self.current_process.poll() is None:
-            self.current_process.terminate()
+        if self.is_playing():
             try:
-                self.current_process.wait(timeout=0.1)
-            except subprocess.TimeoutExpired:
-                self.current_process.kill()
+                self.current_process.terminate()
+                try:
+                    await asyncio.wait_for(asyncio.shield(self._exited), timeout=0.1)
+                except TimeoutError:
+                    self.current_process.kill()
+            except ProcessLookupError:
+                pass  # Exited on its own in the meantime
 
         self.current_process = None
         self.play_start_time = None
         self._current_audio_file = None
+        self._exited = None
 
         return audio_file
 
@@ -119,11 +136,12 @@ class AudioPlayer:
         Returns:
             Path to the finished audio file if playback ended, None otherwise.
         """
-        if self.current_process and self.current_process.poll() is not None:
+        if self._exited is not None and self._exited.done():
             audio_file = self._current_audio_file
             self.current_process = None
             self.play_start_time = None
             self._current_audio_file = None
+            self._exited = None
             return audio_file
         return None
 
@@ -142,29 +160,35 @@ class AudioPlayer:
             return
 
         log.debug("Playing chime")
-        proc = subprocess.Popen(
-            player + [str(chime_file)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+        proc = await asyncio.create_subprocess_exec(
+            *player,
+            str(chime_file),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
 
         # Wait briefly for chime (but not forever)
-        elapsed = 0.0
-        while elapsed < max_wait:
-            if proc.poll() is not None:
-                break
-            await asyncio.sleep(0.05)
-            elapsed += 0.05
-
-        if proc.poll() is None:
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=max_wait)
+        except TimeoutError:
             proc.terminate()
+            await proc.wait()
 
     def play_drop_sound(self, drop_file: Path | None) -> None:
-        """Play drop tone (fire-and-forget).
+        """Play drop tone (fire-and-forget). Must be called from the event loop.
 
         Args:
             drop_file: Path to the drop sound file.
         """
         if drop_file:
             log.debug("Playing drop tone")
-            play_sound_async(drop_file)
+            # Keep a reference so the task is not garbage collected mid-spawn
+            task = asyncio.get_running_loop().create_task(play_sound_async(drop_file))
+            self._sound_tasks.add(task)
+            task.add_done_callback(self._sound_done)
+
+    def _sound_done(self, task: asyncio.Task) -> None:
+        """Forget a finished drop tone task, logging a failure to start the player."""
+        self._sound_tasks.discard(task)
+        if not task.cancelled() and (e := task.exception()) is not None:
+            log.warning("Drop tone failed: %s", e)
@@ -1,80 +1,109 @@
 """Sound effect generation for chimes and drop tones."""
 
+import functools
 import os
 import tempfile
 import time
+import wave
+from collections.abc import Callable
 from pathlib import Path
 
 import numpy as np
-import soundfile as sf
 
 from .logging import get_logger
 
 log = get_logger()
 
 
+@functools.lru_cache(maxsize=8)
+def _time_axis(duration: float, sample_rate: int) -> np.ndarray:
+    """Sample times for a sound of the given duration (shared, read-only)."""
+    t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
+    t.setflags(write=False)
+    return t
+
+
+def _harmonic_phases(freq: float, harmonics: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Phase matrix (len(harmonics), len(t)) for the given harmonics of freq."""
+    return np.outer(np.float32(2 * np.pi * freq) * harmonics, t)
+
+
+@functools.lru_cache(maxsize=4)
 def generate_chime(sample_rate: int = 24000) -> np.ndarray:
     """Generate two-note chime (G5 -> C6) for interrupts.
 
+    Cached per sample rate; the returned array is shared and read-only.
+
     Returns:
         Audio as float32 numpy array.
     """
+    # Fundamental + harmonics
+    harmonics = np.array([1, 2, 3], dtype=np.float32)
+    amplitudes = np.array([1.0, 0.3, 0.1], dtype=np.float32)
+
     def make_note(freq: float, duration: float, amplitude: float = 0.25) -> np.ndarray:
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        # Fundamental + harmonics
-        note = amplitude * np.sin(2 * np.pi * freq * t)
-        note += amplitude * 0.3 * np.sin(2 * np.pi * freq * 2 * t)
-        note += amplitude * 0.1 * np.sin(2 * np.pi * freq * 3 * t)
+        t = _time_axis(duration, sample_rate)
+        phases = _harmonic_phases(freq, harmonics, t)
+        note = (amplitude * amplitudes) @ np.sin(phases, out=phases)
         # Envelope with attack and decay
-        envelope = np.exp(-t * 8)
+        envelope = np.exp(t * np.float32(-8))
         attack = int(len(t) * 0.05)
-        envelope[:attack] *= np.linspace(0, 1, attack)
-        return note * envelope
+        envelope[:attack] *= np.linspace(0, 1, attack, dtype=np.float32)
+        note *= envelope
+        return note
 
     note1 = make_note(784, 0.08)  # G5
     note2 = make_note(1047, 0.08)  # C6
-    gap = np.zeros(int(sample_rate * 0.03))
+    gap = np.zeros(int(sample_rate * 0.03), dtype=np.float32)
     chime = np.concatenate([note1, gap, note2])
 
     # Fade out
     fade = int(sample_rate * 0.02)
     if fade > 0:
-        chime[-fade:] *= np.linspace(1, 0, fade)
+        chime[-fade:] *= np.linspace(1, 0, fade, dtype=np.float32)
 
-    return chime.astype(np.float32)
+    chime.setflags(write=False)
+    return chime
 
 
+@functools.lru_cache(maxsize=4)
 def generate_drop_tone(sample_rate: int = 24000) -> np.ndarray:
     """Generate soft kalimba-like pluck for dropped messages.
 
+    Cached per sample rate; the returned array is shared and read-only.
+
     Returns:
         Audio as float32 numpy array.
     """
-    duration = 0.15
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    t = _time_axis(0.15, sample_rate)
 
     # Base frequency - E5, gentle and musical
     freq = 659
 
     # Fundamental with decaying harmonics (kalimba/music box character)
-    tone = np.sin(2 * np.pi * freq * t)
-    tone += 0.5 * np.sin(2 * np.pi * freq * 2 * t) * np.exp(-t * 20)
-    tone += 0.25 * np.sin(2 * np.pi * freq * 3 * t) * np.exp(-t * 30)
-    tone += 0.1 * np.sin(2 * np.pi * freq * 4 * t) * np.exp(-t * 40)
+    harmonics = np.array([1, 2, 3, 4], dtype=np.float32)
+    amplitudes = np.array([1.0, 0.5, 0.25, 0.1], dtype=np.float32)
+    decays = np.array([0, 20, 30, 40], dtype=np.float32)
+    partials = _harmonic_phases(freq, harmonics, t)
+    np.sin(partials, out=partials)
+    partials *= np.exp(np.outer(-decays, t))
+    tone = amplitudes @ partials
 
     # Pluck envelope - quick attack, smooth decay
     attack_time = 0.005
     attack_samples = int(sample_rate * attack_time)
-    envelope = np.exp(-t * 10)
-    envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+    envelope = np.exp(t * np.float32(-10))
+    envelope[:attack_samples] = np.linspace(0, 1, attack_samples, dtype=np.float32)
 
-    pluck = tone * envelope * 0.18
+    pluck = tone * envelope
+    pluck *= np.float32(0.18)
 
     # Soft fade out
     fade = int(sample_rate * 0.03)
-    pluck[-fade:] *= np.linspace(1, 0, fade)
+    pluck[-fade:] *= np.linspace(1, 0, fade, dtype=np.float32)
 
-    return pluck.astype(np.float32)
+    pluck.setflags(write=False)
+    return pluck
 
 
 def _check_rubberband_available() -> None:
@@ -147,6 +176,26 @@ def time_stretch(audio: np.ndarray, sample_rate: int, speed: float) -> np.ndarra
     return result
 
 
+def write_wav(path: Path, audio: np.ndarray, sample_rate: int) -> None:
+    """Write float audio in [-1, 1] as a 16-bit PCM WAV file.
+
+    Uses the stdlib wave module: one header and one frames write, without
+    going through libsndfile. Same format soundfile writes for WAV by default.
+
+    Args:
+        path: Destination file.
+        audio: Audio samples, shape (frames,) or (frames, channels).
+        sample_rate: Sample rate in Hz.
+    """
+    pcm = np.clip(audio, -1.0, 1.0) * 32767
+    np.rint(pcm, out=pcm)
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1 if audio.ndim == 1 else audio.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.astype("<i2").tobytes())
+
+
 def save_audio(audio: np.ndarray, sample_rate: int = 24000, speed: float = 1.0) -> Path:
     """Save audio to a temporary WAV file.
 
@@ -168,12 +217,22 @@ def save_audio(audio: np.ndarray, sample_rate: int = 24000, speed: float = 1.0)
     start = time.perf_counter()
     with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
         path = Path(f.name)
-    sf.write(path, audio, sample_rate)
+    write_wav(path, audio, sample_rate)
     elapsed = time.perf_counter() - start
     log.trace(f"Audio file save: {elapsed:.3f}s")
     return path
 
 
+# Bump when generate_chime/generate_drop_tone change, to invalidate cached files
+SOUND_CACHE_VERSION = 1
+
+
+def sound_cache_dir() -> Path:
+    """Directory where generated sound effects are cached across runs."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "claude-code-tts-hooks"
+
+
 class SoundManager:
     """Manages sound effect files."""
 
@@ -181,19 +240,48 @@ class SoundManager:
         self.sample_rate = sample_rate
         self.chime_file: Path | None = None
         self.drop_file: Path | None = None
+        self._temp_files: list[Path] = []
 
     def init_sounds(self) -> None:
-        """Generate and save sound effect files."""
-        self.chime_file = save_audio(generate_chime(self.sample_rate), self.sample_rate)
-        self.drop_file = save_audio(generate_drop_tone(self.sample_rate), self.sample_rate)
+        """Load sound effect files, generating and caching them if missing."""
+        self.chime_file = self._get_sound("chime", generate_chime)
+        self.drop_file = self._get_sound("drop", generate_drop_tone)
+
+    def _get_sound(self, name: str, generate: Callable[[int], np.ndarray]) -> Path:
+        """Return the cached file for a sound, writing it on first use.
+
+        Falls back to a temporary file (deleted on cleanup) if the cache
+        directory is not writable.
+        """
+        path = sound_cache_dir() / f"{name}_v{SOUND_CACHE_VERSION}_{self.sample_rate}.wav"
+        if path.exists():
+            return path
+
+        audio = generate(self.sample_rate)
+        # Write then rename, so a concurrent start never sees a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_wav(tmp_path, audio, self.sample_rate)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(f"Could not cache {name} sound in {path.parent}: {e}")
+            # Don't leave a partial file behind in the cache directory
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            path = save_audio(audio, self.sample_rate)
+            self._temp_files.append(path)
+        return path
 
     def cleanup(self) -> None:
-        """Delete sound effect files."""
-        for f in [self.chime_file, self.drop_file]:
-            if f and f.exists():
-                try:
-                    os.unlink(f)
-                except OSError:
-                    pass
+        """Release sound effect files (cached files are kept for the next run)."""
+        for f in self._temp_files:
+            try:
+                os.unlink(f)
+            except OSError:
+                pass
+        self._temp_files.clear()
         self.chime_file = None
         self.drop_file = None
@@ -1,25 +1,130 @@
 """Transcript parsing for Claude Code JSONL transcripts."""
 
-import json
-import re
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+
+import orjson
 
 # Default max content length (~5k tokens worth)
 DEFAULT_MAX_CONTENT_LENGTH = 20000
 
+# Prefixed to content cut down to max_content_length
+TRUNCATION_MARKER = "[Earlier content truncated...]\n\n"
+
+# Tool input values longer than this are cut and end with "..."
+MAX_TOOL_VALUE_LENGTH = 150
+
+# The "type" value of user and assistant entries. A line containing neither
+# (as a JSON string) is some other entry type and needn't be decoded.
+_MESSAGE_MARKERS = ('"user"', '"assistant"')
+_MESSAGE_MARKERS_BYTES = (b'"user"', b'"assistant"')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParsedTranscript:
     """Result of parsing a transcript."""
 
     content: str
     has_tool_calls: bool
-    length: int
     truncated: bool = False
+    length: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive length from content (frozen, so set via object.__setattr__)."""
+        object.__setattr__(self, "length", len(self.content))
+
+
+def _is_interrupt(result_content: str) -> bool:
+    """Check if tool_result text shows the user rejected the tool use.
+
+    Matches "The user doesn't want to proceed" (with any apostrophe) or
+    "tool use was rejected", case-insensitively.
+    """
+    lower = result_content.lower()
+    if "tool use was rejected" in lower:
+        return True
+    i = lower.find("the user doesn")
+    while i != -1:
+        if lower.startswith("t want to proceed", i + 15):
+            return True
+        i = lower.find("the user doesn", i + 1)
+    return False
+
+
+def _truncate_value(value: object) -> str:
+    """Format a tool input value, truncated to MAX_TOOL_VALUE_LENGTH characters."""
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > MAX_TOOL_VALUE_LENGTH:
+        return text[:MAX_TOOL_VALUE_LENGTH] + "..."
+    return text
+
+
+def _is_boundary(entry: dict) -> bool:
+    """Check if an entry is a real user message or an interrupt.
+
+    An interrupt is when the user rejects a tool use.
+    """
+    if entry.get("type") != "user":
+        return False
+
+    msg_content = entry.get("message", {}).get("content", [])
+
+    # Handle string content (from context summarization) - treat as real user message
+    if isinstance(msg_content, str):
+        return True
+
+    if not isinstance(msg_content, list):
+        return False
+
+    # A message with no tool_result is a real user message
+    has_tool_result = False
+    for c in msg_content:
+        if not isinstance(c, dict) or c.get("type") != "tool_result":
+            continue
+        has_tool_result = True
+
+        # Check for interrupt (rejected tool use)
+        result_content = c.get("content", "")
+        if isinstance(result_content, str):
+            if _is_interrupt(result_content):
+                return True
+
+    return not has_tool_result
+
+
+def _assistant_content(entry: dict) -> list | None:
+    """Get the content list of an assistant entry, or None for other entries."""
+    if entry.get("type") != "assistant":
+        return None
+    msg_content = entry.get("message", {}).get("content", [])
+    return msg_content if isinstance(msg_content, list) else None
+
+
+def _has_tool_use(entry: dict) -> bool:
+    """Check if an entry is an assistant message containing a tool call."""
+    msg_content = _assistant_content(entry)
+    return msg_content is not None and any(
+        isinstance(item, dict) and item.get("type") == "tool_use" for item in msg_content
+    )
+
+
+def _loads_line(line: str | memoryview) -> object | None:
+    """Decode one JSONL line, or return None if it is not valid JSON."""
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        pass
+    if isinstance(line, memoryview):
+        # orjson rejects invalid UTF-8; keep such lines with replacement characters
+        try:
+            return orjson.loads(str(line, "utf-8", errors="replace"))
+        except orjson.JSONDecodeError:
+            pass
+    return None
 
 
 def parse_transcript(
-    content: str,
+    content: str | bytes,
     max_content_length: int = DEFAULT_MAX_CONTENT_LENGTH,
 ) -> ParsedTranscript | None:
     """Parse Claude Code transcript JSONL content.
@@ -28,95 +133,82 @@ def parse_transcript(
     This mirrors the jq logic from the shell scripts.
 
     Args:
-        content: JSONL content string (newline-separated JSON objects).
+        content: JSONL content (newline-separated JSON objects), as str or
+            UTF-8 bytes. Bytes are parsed directly without decoding first.
         max_content_length: Maximum content length before truncation (default 20000).
 
     Returns:
         ParsedTranscript with content and metadata, or None if no content.
     """
-    if not content or not content.strip():
-        return None
-
-    # Parse JSONL content
-    entries = []
-    for line in content.splitlines():
-        line = line.strip()
-        if line:
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-    if not entries:
+    if not content or content.isspace():
         return None
 
-    # Find boundary: last real user message OR last interrupt
-    # An interrupt is when user rejects a tool use
-    last_user_idx = -1
-    last_interrupt_idx = -1
-
-    for i, entry in enumerate(entries):
-        if entry.get("type") != "user":
+    # Find the non-empty lines with find; orjson skips surrounding whitespace
+    # itself. Only offsets are kept, so lines before the boundary, which are
+    # never decoded, are never copied either. Bytes are decoded from a
+    # memoryview for the same reason.
+    if isinstance(content, bytes):
+        buf, newline, markers = memoryview(content), b"\n", _MESSAGE_MARKERS_BYTES
+    else:
+        buf, newline, markers = content, "\n", _MESSAGE_MARKERS
+    user_marker, assistant_marker = markers
+    lines = []
+    pos = 0
+    end = len(content)
+    while pos < end:
+        nl = content.find(newline, pos)
+        if nl == -1:
+            nl = end
+        if nl > pos:
+            lines.append((pos, nl))
+        pos = nl + 1
+
+    # Walk back from the end, decoding lazily, until the boundary: the last
+    # real user message OR the last interrupt. Only the tail after it is parsed.
+    tail = []
+    for start, stop in reversed(lines):
+        # Other entry types (summaries, snapshots, ...) can't be part of the
+        # turn, so skip them without decoding
+        if (
+            content.find(user_marker, start, stop) == -1
+            and content.find(assistant_marker, start, stop) == -1
+        ):
             continue
-
-        msg_content = entry.get("message", {}).get("content", [])
-
-        # Handle string content (from context summarization) - treat as real user message
-        if isinstance(msg_content, str):
-            last_user_idx = i
-            continue
-
-        if not isinstance(msg_content, list):
+        entry = _loads_line(buf[start:stop])
+        if entry is None:
             continue
-
-        # Check if this is a tool_result message (not a real user message)
-        has_tool_result = any(
-            isinstance(c, dict) and c.get("type") == "tool_result"
-            for c in msg_content
-        )
-
-        if not has_tool_result:
-            last_user_idx = i
-
-        # Check for interrupt (rejected tool use)
-        for c in msg_content:
-            if not isinstance(c, dict) or c.get("type") != "tool_result":
-                continue
-            result_content = c.get("content", "")
-            if isinstance(result_content, str):
-                if re.search(
-                    r"The user doesn.t want to proceed|tool use was rejected",
-                    result_content,
-                    re.IGNORECASE,
-                ):
-                    last_interrupt_idx = i
-                    break
-
-    # Use the more recent boundary
-    boundary_idx = max(last_user_idx, last_interrupt_idx)
-
-    # Collect assistant content after the boundary
-    content_parts = []
+        if _is_boundary(entry):
+            break
+        tail.append(entry)
+
+    # Collect assistant content after the boundary, newest first. Once the
+    # joined parts are longer than the limit, everything earlier would be
+    # truncated away, so earlier entries are only checked for tool calls.
+    content_parts: deque[str] = deque()
+    joined_len = -2  # length of "\n\n".join(content_parts)
     has_tool_calls = False
 
-    for entry in entries[boundary_idx + 1:]:
-        if entry.get("type") != "assistant":
+    for entry in tail:
+        if joined_len > max_content_length:
+            if has_tool_calls:
+                break
+            has_tool_calls = _has_tool_use(entry)
             continue
 
-        msg_content = entry.get("message", {}).get("content", [])
-        if not isinstance(msg_content, list):
+        msg_content = _assistant_content(entry)
+        if msg_content is None:
             continue
 
-        for item in msg_content:
+        for item in reversed(msg_content):
             if not isinstance(item, dict):
                 continue
 
             item_type = item.get("type")
 
             if item_type == "text":
-                text = item.get("text", "")
-                if text:
-                    content_parts.append(text)
+                part = item.get("text", "")
+                if not part:
+                    continue
 
             elif item_type == "tool_use":
                 has_tool_calls = True
@@ -124,15 +216,14 @@ def parse_transcript(
                 tool_input = item.get("input", {})
 
                 # Format tool call with truncated values
-                params = []
-                for k, v in tool_input.items():
-                    v_str = str(v) if not isinstance(v, str) else v
-                    if len(v_str) > 150:
-                        v_str = v_str[:150] + "..."
-                    params.append(f"{k}: {v_str}")
+                params = ", ".join(f"{k}: {_truncate_value(v)}" for k, v in tool_input.items())
+                part = f"[Tool: {tool_name}] {params}"
+
+            else:
+                continue
 
-                tool_str = f"[Tool: {tool_name}] {', '.join(params)}"
-                content_parts.append(tool_str)
+            content_parts.appendleft(part)
+            joined_len += len(part) + 2
 
     if not content_parts:
         return None
@@ -142,12 +233,11 @@ def parse_transcript(
     # Truncate from the beginning if content is too long (keep most recent)
     truncated = False
     if len(full_content) > max_content_length:
-        full_content = "[Earlier content truncated...]\n\n" + full_content[-max_content_length:]
+        full_content = TRUNCATION_MARKER + full_content[-max_content_length:]
         truncated = True
 
     return ParsedTranscript(
         content=full_content,
         has_tool_calls=has_tool_calls,
-        length=len(full_content),
         truncated=truncated,
     )
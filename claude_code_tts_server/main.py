@@ -1,8 +1,6 @@
 """Main entry point for Claude Code TTS Server."""
 
 import logging
-import signal
-import sys
 import warnings
 from contextlib import asynccontextmanager
 
@@ -12,8 +10,8 @@ from fastapi import FastAPI, Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from .api.routes import router
-from .core.context import clear_request_id, set_request_id
-from .config import AudioConfig, ServerConfig, SummarizerConfig, TTSConfig
+from .core.context import clear_request_id, get_request_id, set_request_id
+from .config import ServerConfig, SummarizerConfig, TTSConfig
 from .core.audio_manager import AudioManager
 from .summarizers.base import SummarizerInterface
 from .summarizers.groq import GroqSummarizer
@@ -22,31 +20,45 @@ from .tts.base import TTSInterface
 from .tts.kokoro import KokoroTTS
 
 
+_SUMMARIZERS: dict[str, type[SummarizerInterface]] = {
+    "groq": GroqSummarizer,
+    "ollama": OllamaSummarizer,
+}
+
+_TTS_BACKENDS: dict[str, type[TTSInterface]] = {
+    "kokoro": KokoroTTS,
+}
+
+# TTS backends accepted by the config but not implemented yet
+_PLANNED_TTS_BACKENDS = {"groq": "Groq", "elevenlabs": "ElevenLabs"}
+
+
 def create_summarizer(config: SummarizerConfig) -> SummarizerInterface:
     """Create the appropriate summarizer based on config."""
-    if config.backend == "ollama":
-        return OllamaSummarizer(config)
-    else:
-        return GroqSummarizer(config)
+    summarizer_class = _SUMMARIZERS.get(config.backend)
+    if summarizer_class is None:
+        raise ValueError(f"Unknown summarizer backend: {config.backend}")
+    return summarizer_class(config)
 
 
 def create_tts(config: TTSConfig) -> TTSInterface:
     """Create the appropriate TTS backend based on config."""
-    if config.backend == "kokoro":
-        return KokoroTTS(config)
-    elif config.backend == "groq":
-        raise NotImplementedError("Groq TTS backend not yet implemented")
-    elif config.backend == "elevenlabs":
-        raise NotImplementedError("ElevenLabs TTS backend not yet implemented")
-    else:
+    tts_class = _TTS_BACKENDS.get(config.backend)
+    if tts_class is None:
+        if config.backend in _PLANNED_TTS_BACKENDS:
+            name = _PLANNED_TTS_BACKENDS[config.backend]
+            raise NotImplementedError(f"{name} TTS backend not yet implemented")
         raise ValueError(f"Unknown TTS backend: {config.backend}")
+    return tts_class(config)
 
 # Suppress warnings from dependencies
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 # Import TRACE level (this also adds .trace() method to Logger)
-from .core.logging import TRACE
+from .core.logging import TRACE, get_logger
+
+log = get_logger()
 
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
@@ -75,8 +87,6 @@ class ColorFormatter(logging.Formatter):
     DIM = "\033[2m"
 
     def format(self, record):
-        from .core.context import get_request_id
-
         color = self.COLORS.get(record.levelno, "")
         record.levelname = f"{color}{record.levelname:<5}{self.RESET}"
 
@@ -117,7 +127,6 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
 
 def create_app(config: ServerConfig) -> FastAPI:
     """Create and configure the FastAPI application."""
-    log = logging.getLogger("tts-server")
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -125,13 +134,15 @@ def create_app(config: ServerConfig) -> FastAPI:
         # Startup
         log.info("Starting TTS server...")
 
-        # Check rubberband availability if speed is configured
-        if config.audio.speed != 1.0:
+        tts = create_tts(config.tts)
+
+        # Check rubberband availability if speed is configured and the
+        # backend cannot change speed itself
+        if config.audio.speed != 1.0 and not tts.supports_speed:
             from .core.sounds import _check_rubberband_available
             _check_rubberband_available()
 
         # Initialize TTS backend
-        tts = create_tts(config.tts)
         await tts.initialize()
 
         # Initialize summarizer
@@ -173,8 +184,6 @@ def create_app(config: ServerConfig) -> FastAPI:
 
 def _log_startup_config(config: ServerConfig) -> None:
     """Log full configuration at startup."""
-    log = logging.getLogger("tts-server")
-
     log.info(f"Server ready on http://{config.host}:{config.port}")
 
     # TTS config
@@ -296,73 +305,45 @@ def main(
     ollama_url: str | None,
 ) -> None:
     """Claude Code TTS Server - Audio feedback via text-to-speech."""
-    # Load base config from env vars first
-    tts_config = TTSConfig()
-    summarizer_config = SummarizerConfig()
-    audio_config = AudioConfig()
-    server_config = ServerConfig()
-
-    # Override with CLI args if provided
-    tts_overrides = {
-        k: v for k, v in {
-            "backend": tts,
-            "kokoro_voice": kokoro_voice,
-            "kokoro_lang": kokoro_lang,
-            "groq_voice": tts_groq_voice,
-            "groq_model": tts_groq_model,
-            "elevenlabs_voice": elevenlabs_voice,
-            "elevenlabs_model": elevenlabs_model,
-        }.items() if v is not None
-    }
-    if tts_overrides:
-        tts_config = TTSConfig(**{**tts_config.model_dump(), **tts_overrides})
-
-    summarizer_overrides = {
-        k: v for k, v in {
-            "backend": summarizer,
-            "ollama_model_large": ollama_model_large,
-            "ollama_model_small": ollama_model_small,
-            "ollama_url": ollama_url,
-        }.items() if v is not None
-    }
-    if summarizer_overrides:
-        summarizer_config = SummarizerConfig(**{**summarizer_config.model_dump(), **summarizer_overrides})
-
-    audio_overrides = {
-        k: v for k, v in {
-            "interrupt": interrupt,
-            "min_duration": min_duration,
-            "queue": queue,
-            "max_queue": max_queue,
-            "interrupt_chime": interrupt_chime,
-            "drop_sound": drop_sound,
-            "speed": speed,
-        }.items() if v is not None
-    }
-    if audio_overrides:
-        audio_config = AudioConfig(**{**audio_config.model_dump(), **audio_overrides})
-
-    server_overrides = {k: v for k, v in {"host": host, "port": port, "log_level": log_level}.items() if v is not None}
-    config = ServerConfig(
-        **{**{"host": server_config.host, "port": server_config.port, "log_level": server_config.log_level}, **server_overrides},
-        tts=tts_config,
-        summarizer=summarizer_config,
-        audio=audio_config,
+    # CLI args override env vars / .env
+    config = ServerConfig.from_cli_args(
+        host=host,
+        port=port,
+        log_level=log_level,
+        tts=tts,
+        kokoro_voice=kokoro_voice,
+        kokoro_lang=kokoro_lang,
+        tts_groq_voice=tts_groq_voice,
+        tts_groq_model=tts_groq_model,
+        elevenlabs_voice=elevenlabs_voice,
+        elevenlabs_model=elevenlabs_model,
+        summarizer=summarizer,
+        ollama_model_large=ollama_model_large,
+        ollama_model_small=ollama_model_small,
+        ollama_url=ollama_url,
+        interrupt=interrupt,
+        min_duration=min_duration,
+        queue=queue,
+        max_queue=max_queue,
+        interrupt_chime=interrupt_chime,
+        drop_sound=drop_sound,
+        speed=speed,
     )
 
     # Setup logging with resolved log level
     setup_logging(config.log_level)
-    log = logging.getLogger("tts-server")
 
     # Create app
     app = create_app(config)
 
-    # Run server
+    # Run server (uvicorn[standard] picks uvloop + httptools when available)
     uvicorn.run(
         app,
         host=config.host,
         port=config.port,
+        limit_concurrency=config.max_connections,
         log_level="warning",  # Suppress uvicorn logs, we have our own
+        access_log=False,  # Requests are logged by the route handlers
     )
 
 
@@ -5,6 +5,10 @@ from dataclasses import dataclass
 from enum import Enum, auto
 
 
+# Responses at least this long (or with tool calls) get summarized, not just cleaned
+LONG_RESPONSE_MIN_CHARS = 300
+
+
 class SummaryType(Enum):
     """Type of content being summarized."""
 
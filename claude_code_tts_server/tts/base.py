@@ -8,17 +8,22 @@ import numpy as np
 class TTSInterface(ABC):
     """Abstract base class for text-to-speech backends."""
 
+    # Whether synthesize() applies its speed argument itself. If not, the
+    # pipeline time-stretches the audio afterwards (requires rubberband).
+    supports_speed: bool = False
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize the TTS backend (load models, etc.)."""
         pass
 
     @abstractmethod
-    async def synthesize(self, text: str) -> np.ndarray | None:
+    async def synthesize(self, text: str, speed: float = 1.0) -> np.ndarray | None:
         """Synthesize speech from text.
 
         Args:
             text: The text to synthesize.
+            speed: Speech rate multiplier (only used if supports_speed).
 
         Returns:
             Audio as numpy array (float32, mono) or None if synthesis failed.
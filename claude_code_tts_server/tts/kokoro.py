@@ -18,16 +18,19 @@ class KokoroTTS(TTSInterface):
     SAMPLE_RATE = 24000
     REPO_ID = "hexgrad/Kokoro-82M"
 
+    supports_speed = True
+
     def __init__(self, config: TTSConfig):
         self.config = config
         self.pipeline = None
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # One dedicated thread: the model is not shared with other blocking work
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro")
 
     async def initialize(self) -> None:
         """Load the Kokoro model."""
         log.debug("Loading Kokoro model...")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def load_model():
             from kokoro import KPipeline
@@ -36,11 +39,12 @@ class KokoroTTS(TTSInterface):
         self.pipeline = await loop.run_in_executor(self._executor, load_model)
         log.debug("Kokoro model loaded")
 
-    async def synthesize(self, text: str) -> np.ndarray | None:
+    async def synthesize(self, text: str, speed: float = 1.0) -> np.ndarray | None:
         """Generate TTS audio from text.
 
         Args:
             text: The text to synthesize.
+            speed: Speech rate multiplier, applied by the model itself.
 
         Returns:
             Audio as numpy array or None if synthesis failed.
@@ -51,11 +55,11 @@ class KokoroTTS(TTSInterface):
             log.error("Kokoro pipeline not initialized")
             return None
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def generate():
             all_audio = []
-            for _, _, audio in self.pipeline(text, voice=self.config.kokoro_voice):
+            for _, _, audio in self.pipeline(text, voice=self.config.kokoro_voice, speed=speed):
                 all_audio.append(audio)
             if not all_audio:
                 return None
@@ -12,6 +12,13 @@ from claude_code_tts_server.summarizers.base import SummaryResult
 from claude_code_tts_server.tts.base import TTSInterface
 
 
+@pytest.fixture(autouse=True)
+def sound_cache(tmp_path, monkeypatch):
+    """Cache generated sound effects in a per-test directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "claude-code-tts-hooks"
+
+
 @pytest.fixture
 def sample_audio():
     """Generate sample audio data."""
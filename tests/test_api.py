@@ -5,17 +5,18 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
 
-from claude_code_tts_server.api.routes import router
+from claude_code_tts_server.api.models import HealthResponse
+from claude_code_tts_server.api.routes import HEALTH_CHECK_TTL, router
 from claude_code_tts_server.core.audio_manager import QueueStatus
-from claude_code_tts_server.summarizers.base import SummaryResult
+from claude_code_tts_server.summarizers.base import SummaryResult, SummaryType
 
 
 @pytest.fixture
 def mock_audio_manager():
     """Create a mock audio manager (pipeline)."""
     manager = AsyncMock()
-    manager.add_message = AsyncMock(return_value="test-message-id")
-    manager.add_request = AsyncMock(return_value="test-request-id")
+    manager.add_message = AsyncMock(return_value=7)
+    manager.add_request = AsyncMock(return_value=42)
     manager.get_status = MagicMock(return_value=QueueStatus(
         pending_requests=0,
         pending_messages=0,
@@ -71,6 +72,29 @@ class TestHealthEndpoint:
         assert data["summarizer_ready"] is True
         assert data["queue_depth"] == 0
 
+    def test_health_check_body_matches_model(self, client, mock_audio_manager):
+        """Test the precomputed all-ready body is identical to the model serialization."""
+        mock_audio_manager.get_status.return_value.pending_messages = 3
+
+        response = client.get("/health")
+
+        expected = HealthResponse(status="ok", tts_ready=True, summarizer_ready=True, queue_depth=3)
+        assert response.content == expected.model_dump_json().encode()
+
+    def test_health_check_cached(self, client, app, mock_summarizer):
+        """Test summarizer health is reused within the TTL and refreshed after."""
+        client.get("/health")
+        client.get("/health")
+        assert mock_summarizer.health_check.await_count == 1
+
+        checked_at, ready = app.state.summarizer_health
+        app.state.summarizer_health = (checked_at - HEALTH_CHECK_TTL, ready)
+        mock_summarizer.health_check.return_value = False
+
+        response = client.get("/health")
+        assert response.json()["summarizer_ready"] is False
+        assert mock_summarizer.health_check.await_count == 2
+
 
 class TestSpeakEndpoint:
     """Tests for /speak endpoint."""
@@ -81,7 +105,7 @@ class TestSpeakEndpoint:
 
         assert response.status_code == 200
         data = response.json()
-        assert data["message_id"] == "test-message-id"
+        assert data["message_id"] == "7"
         assert data["status"] == "queued"
 
         mock_audio_manager.add_message.assert_called_once_with("Hello world")
@@ -106,7 +130,7 @@ class TestSummarizeEndpoint:
 
         assert response.status_code == 200
         data = response.json()
-        assert data["message_id"] == "test-request-id"
+        assert data["message_id"] == "42"
         assert data["status"] == "queued"
 
         # Should queue request, not call summarizer directly
@@ -127,6 +151,62 @@ class TestSummarizeEndpoint:
 
         assert response.status_code == 422  # Pydantic validation error
 
+    def test_summarize_raw_jsonl(self, client, mock_audio_manager, sample_transcript_with_tools):
+        """Test summarize with the transcript sent as the raw JSONL body."""
+        response = client.post(
+            "/summarize",
+            content=sample_transcript_with_tools.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message_id"] == "42"
+
+        kwargs = mock_audio_manager.add_request.call_args.kwargs
+        assert "[Tool: Bash]" in kwargs["content"]
+        assert kwargs["summary_type"] == SummaryType.LONG_RESPONSE
+
+    def test_summarize_short_response_type(self, client, mock_audio_manager, sample_transcript_jsonl):
+        """Test that a short text-only response is only cleaned, not summarized."""
+        client.post("/summarize", json={"transcript_content": sample_transcript_jsonl})
+
+        kwargs = mock_audio_manager.add_request.call_args.kwargs
+        assert kwargs["summary_type"] == SummaryType.SHORT_RESPONSE
+
+    def test_summarize_large_transcript(
+        self, client, mock_audio_manager, sample_transcript_with_tools, monkeypatch
+    ):
+        """Test large transcripts are parsed off the event loop."""
+        monkeypatch.setattr("claude_code_tts_server.api.routes.PARSE_IN_THREAD_MIN_SIZE", 1)
+        response = client.post(
+            "/summarize",
+            content=sample_transcript_with_tools.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert "[Tool: Bash]" in mock_audio_manager.add_request.call_args.kwargs["content"]
+
+    def test_summarize_raw_jsonl_empty(self, client):
+        """Test summarize with an empty raw JSONL body."""
+        response = client.post(
+            "/summarize",
+            content=b"",
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 400
+
+    def test_summarize_malformed_json(self, client):
+        """Test summarize with a body that is not valid JSON."""
+        response = client.post(
+            "/summarize",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+
 
 class TestPermissionEndpoint:
     """Tests for /permission endpoint."""
@@ -143,7 +223,7 @@ class TestPermissionEndpoint:
 
         assert response.status_code == 200
         data = response.json()
-        assert data["message_id"] == "test-request-id"
+        assert data["message_id"] == "42"
         assert data["status"] == "queued"
 
         # Should queue request, not call summarizer directly
@@ -164,6 +244,60 @@ class TestPermissionEndpoint:
 
         assert response.status_code == 200
 
+        content = mock_audio_manager.add_request.call_args.kwargs["content"]
+        assert content == (
+            "Tool: Bash. Description: Install dependencies. "
+            'Input: {"command":"npm install","description":"Install dependencies"}'
+        )
+
+    def test_permission_full_hook_payload(self, client, mock_audio_manager):
+        """Test that extra hook payload fields are ignored."""
+        response = client.post(
+            "/permission",
+            json={
+                "session_id": "abc123",
+                "transcript_path": "/tmp/transcript.jsonl",
+                "hook_event_name": "PermissionRequest",
+                "tool_name": "Bash",
+                "tool_input": {"command": "ls"},
+            },
+        )
+
+        assert response.status_code == 200
+        mock_audio_manager.add_request.assert_called_once()
+
+    def test_permission_missing_tool_input(self, client, mock_audio_manager):
+        """Test permission without tool_input is rejected."""
+        response = client.post("/permission", json={"tool_name": "Bash"})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "tool_input"]
+        mock_audio_manager.add_request.assert_not_called()
+
+
+class TestOpenAPI:
+    """Tests for the generated OpenAPI schema."""
+
+    def test_request_bodies_documented(self, client):
+        """Test that endpoints decoding their own body still document it."""
+        paths = client.get("/openapi.json").json()["paths"]
+
+        for path, field in [
+            ("/summarize", "transcript_content"),
+            ("/permission", "tool_name"),
+            ("/speak", "text"),
+        ]:
+            body = paths[path]["post"]["requestBody"]
+            schema = body["content"]["application/json"]["schema"]
+            assert field in schema["properties"]
+
+    def test_response_models_documented(self, client):
+        """Test that pre-serialized responses keep their documented schema."""
+        paths = client.get("/openapi.json").json()["paths"]
+
+        schema = paths["/health"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert schema["$ref"].endswith("/HealthResponse")
+
 
 class TestQueueEndpoints:
     """Tests for queue management endpoints."""
@@ -209,3 +343,12 @@ class TestQueueEndpoints:
         assert data["status"] == "ok"
 
         mock_audio_manager.skip_current.assert_called_once()
+
+    def test_skip_nothing_playing(self, client, mock_audio_manager):
+        """Test skip when nothing is playing."""
+        mock_audio_manager.skip_current.return_value = False
+
+        response = client.post("/queue/skip")
+
+        assert response.status_code == 200
+        assert response.json() == {"skipped": False, "status": "ok"}
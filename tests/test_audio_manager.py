@@ -0,0 +1,365 @@
+"""Tests for the audio pipeline."""
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_code_tts_server.core.audio_manager import AudioPipeline, PendingRequest, RequestType
+from claude_code_tts_server.core.context import clear_request_id, get_request_id, set_request_id
+from claude_code_tts_server.core.sounds import save_audio
+from claude_code_tts_server.summarizers.base import SummaryResult, SummaryType
+
+
+@pytest.fixture(autouse=True)
+def no_player(monkeypatch):
+    """Never start a real audio player."""
+    monkeypatch.setattr("claude_code_tts_server.core.playback.get_player", lambda: None)
+
+
+@pytest.fixture
+def echo_summarizer(mock_summarizer):
+    """Summarizer that returns the request content, optionally gated."""
+    mock_summarizer.gate = asyncio.Event()
+    mock_summarizer.gate.set()
+
+    async def summarize(request):
+        await mock_summarizer.gate.wait()
+        return SummaryResult(text=request.content, model_used="test-model")
+
+    mock_summarizer.summarize.side_effect = summarize
+    return mock_summarizer
+
+
+@pytest.fixture
+def pipeline(audio_config, mock_tts, echo_summarizer):
+    """Create a pipeline with workers not started."""
+    return AudioPipeline(audio_config, mock_tts, echo_summarizer)
+
+
+async def wait_until(condition, timeout: float = 1.0) -> None:
+    """Wait for condition() to become true."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def add_summarize(pipeline: AudioPipeline, content: str) -> str:
+    """Queue a summarize request."""
+    return await pipeline.add_request(
+        RequestType.SUMMARIZE, content, summary_type=SummaryType.SHORT_RESPONSE
+    )
+
+
+class TestQueueing:
+    """Tests for adding to the pipeline queues."""
+
+    async def test_add_request(self, pipeline):
+        """Test requests are queued in order."""
+        await add_summarize(pipeline, "first")
+        await add_summarize(pipeline, "second")
+
+        assert pipeline.get_status().pending_requests == 2
+        assert pipeline.pending_requests.get_nowait().content == "first"
+
+    async def test_ids_unique(self, pipeline):
+        """Test request and message IDs are distinct integers."""
+        ids = [
+            await add_summarize(pipeline, "request"),
+            await pipeline.add_message("message"),
+            await add_summarize(pipeline, "another request"),
+        ]
+        assert all(isinstance(item_id, int) for item_id in ids)
+        assert len(set(ids)) == 3
+
+    async def test_queue_full_drops_oldest(self, audio_config, mock_tts, echo_summarizer):
+        """Test the oldest request is dropped when the queue is full."""
+        audio_config.max_queue = 2
+        pipeline = AudioPipeline(audio_config, mock_tts, echo_summarizer)
+
+        for content in ("one", "two", "three"):
+            await add_summarize(pipeline, content)
+
+        assert pipeline.pending_requests.qsize() == 2
+        assert pipeline.pending_requests.get_nowait().content == "two"
+
+    async def test_no_queue_keeps_latest(self, audio_config, mock_tts, echo_summarizer):
+        """Test no-queue mode replaces pending requests and messages."""
+        audio_config.queue = False
+        pipeline = AudioPipeline(audio_config, mock_tts, echo_summarizer)
+
+        await add_summarize(pipeline, "old")
+        await add_summarize(pipeline, "new")
+        await pipeline.add_message("old message")
+        await pipeline.add_message("new message")
+
+        assert pipeline.pending_requests.qsize() == 1
+        assert pipeline.pending_requests.get_nowait().content == "new"
+        assert pipeline.pending_messages.qsize() == 1
+        assert pipeline.pending_messages.get_nowait().text == "new message"
+
+    async def test_drop_sound_once_per_add(self, audio_config, mock_tts, echo_summarizer):
+        """Test replacing several pending items plays the drop sound only once."""
+        audio_config.queue = False
+        pipeline = AudioPipeline(audio_config, mock_tts, echo_summarizer)
+        pipeline._play_drop_sound = MagicMock()
+
+        # Fill the queue directly, as if several arrived before no-queue replacement
+        for content in ("one", "two", "three"):
+            pipeline.pending_requests.put_nowait(
+                PendingRequest.create(RequestType.SUMMARIZE, content)
+            )
+        await add_summarize(pipeline, "latest")
+
+        pipeline._play_drop_sound.assert_called_once()
+        assert pipeline.pending_requests.qsize() == 1
+
+    async def test_clear_queue(self, pipeline):
+        """Test clear_queue empties all stages and counts items."""
+        await add_summarize(pipeline, "request")
+        await pipeline.add_message("message")
+
+        assert await pipeline.clear_queue() == 2
+
+        status = pipeline.get_status()
+        assert status.pending_requests == 0
+        assert status.pending_messages == 0
+
+
+class TestWorkers:
+    """Tests for the pipeline workers."""
+
+    async def test_summarize_to_ready_audio(self, pipeline, mock_tts):
+        """Test a request flows through summarization and TTS."""
+        worker_tasks = [
+            asyncio.create_task(pipeline._summarizer_worker()),
+            asyncio.create_task(pipeline._generator_worker()),
+        ]
+        try:
+            await add_summarize(pipeline, "Build finished")
+            await wait_until(lambda: pipeline.ready_audio)
+        finally:
+            for task in worker_tasks:
+                task.cancel()
+            await asyncio.gather(*worker_tasks, return_exceptions=True)
+
+        mock_tts.synthesize.assert_awaited_once_with("Build finished", speed=1.0)
+        ready = pipeline.ready_audio.popleft()
+        assert ready.text == "Build finished"
+        ready.audio_file.unlink()
+
+    async def test_no_queue_discards_in_progress_request(
+        self, audio_config, mock_tts, echo_summarizer
+    ):
+        """Test a newer request makes the one being summarized stale."""
+        audio_config.queue = False
+        pipeline = AudioPipeline(audio_config, mock_tts, echo_summarizer)
+        echo_summarizer.gate.clear()
+
+        worker = asyncio.create_task(pipeline._summarizer_worker())
+        try:
+            await add_summarize(pipeline, "stale")
+            await wait_until(lambda: echo_summarizer.summarize.await_count == 1)
+            await add_summarize(pipeline, "latest")
+            echo_summarizer.gate.set()
+            await wait_until(lambda: echo_summarizer.summarize.await_count == 2)
+            await wait_until(lambda: pipeline.get_status().pending_requests == 0)
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert pipeline.pending_messages.qsize() == 1
+        assert pipeline.pending_messages.get_nowait().text == "latest"
+
+    async def test_queue_mode_summarizes_next_request_ahead(self, pipeline, echo_summarizer):
+        """Test the next request is summarized while the current one completes."""
+        echo_summarizer.gate.clear()
+
+        worker = asyncio.create_task(pipeline._summarizer_worker())
+        try:
+            await add_summarize(pipeline, "first")
+            await add_summarize(pipeline, "second")
+            await wait_until(lambda: echo_summarizer.summarize.await_count == 2)
+            assert pipeline.get_status().pending_requests == 2
+
+            echo_summarizer.gate.set()
+            await wait_until(lambda: pipeline.pending_messages.qsize() == 2)
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert pipeline.pending_messages.get_nowait().text == "first"
+        assert pipeline.pending_messages.get_nowait().text == "second"
+
+    async def test_summarized_ahead_request_counts_against_max_queue(
+        self, audio_config, mock_tts, echo_summarizer
+    ):
+        """Test the request summarized ahead is dropped first when the queue is full."""
+        audio_config.max_queue = 2
+        pipeline = AudioPipeline(audio_config, mock_tts, echo_summarizer)
+        pushed = []
+        pipeline._push_message = lambda msg: pushed.append(msg.text)
+        echo_summarizer.gate.clear()
+
+        worker = asyncio.create_task(pipeline._summarizer_worker())
+        try:
+            await add_summarize(pipeline, "first")
+            await add_summarize(pipeline, "second")
+            await wait_until(lambda: echo_summarizer.summarize.await_count == 2)
+            await add_summarize(pipeline, "third")
+            await add_summarize(pipeline, "fourth")
+
+            # The active request plus max_queue waiting ones
+            assert pipeline.get_status().pending_requests == 3
+
+            echo_summarizer.gate.set()
+            await wait_until(lambda: len(pushed) == 3)
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert pushed == ["first", "third", "fourth"]
+
+    async def test_clear_discards_summarized_ahead_request(self, pipeline, echo_summarizer):
+        """Test clear_queue also discards a request being summarized ahead."""
+        echo_summarizer.gate.clear()
+
+        worker = asyncio.create_task(pipeline._summarizer_worker())
+        try:
+            await add_summarize(pipeline, "first")
+            await add_summarize(pipeline, "second")
+            await wait_until(lambda: echo_summarizer.summarize.await_count == 2)
+
+            assert await pipeline.clear_queue() == 2
+            echo_summarizer.gate.set()
+            await asyncio.sleep(0.05)
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert pipeline.pending_messages.empty()
+
+    async def test_summary_start_restores_request_id(self, pipeline, echo_summarizer):
+        """Test starting a summary logs under its request ID without changing the caller's."""
+        seen = []
+
+        async def summarize(request):
+            seen.append(get_request_id())
+            return SummaryResult(text=request.content, model_used="test-model")
+
+        echo_summarizer.summarize.side_effect = summarize
+        set_request_id("current")
+        try:
+            for request_id in ("next", None):
+                req = PendingRequest(1, request_id, RequestType.SUMMARIZE, "text")
+                await pipeline._start_summary(req)
+                assert get_request_id() == "current"
+        finally:
+            clear_request_id()
+
+        assert seen == ["next", None]
+
+    async def test_speed_applied_by_backend(self, audio_config, mock_tts, echo_summarizer, monkeypatch):
+        """Test speed is passed to backends with native speed control, not time-stretched."""
+        audio_config.speed = 1.3
+        mock_tts.supports_speed = True
+        pipeline = AudioPipeline(audio_config, mock_tts, echo_summarizer)
+        saved_speeds = []
+
+        def fake_save_audio(audio, sample_rate, speed):
+            saved_speeds.append(speed)
+            return Path("/nonexistent.wav")
+
+        monkeypatch.setattr("claude_code_tts_server.core.audio_manager.save_audio", fake_save_audio)
+
+        worker = asyncio.create_task(pipeline._generator_worker())
+        try:
+            await pipeline.add_message("Faster")
+            await wait_until(lambda: pipeline.ready_audio)
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        mock_tts.synthesize.assert_awaited_once_with("Faster", speed=1.3)
+        assert saved_speeds == [1.0]
+
+    async def test_clear_during_save_discards_audio(self, pipeline, monkeypatch, tmp_path):
+        """Test a message cleared while its audio is being saved never becomes ready."""
+        audio_file = tmp_path / "cleared.wav"
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_save_audio(*args):
+            audio_file.touch()
+            started.set()
+            release.wait(1.0)
+            return audio_file
+
+        monkeypatch.setattr("claude_code_tts_server.core.audio_manager.save_audio", slow_save_audio)
+
+        worker = asyncio.create_task(pipeline._generator_worker())
+        try:
+            await pipeline.add_message("Cleared")
+            await wait_until(started.is_set)
+            assert await pipeline.clear_queue() == 1
+            release.set()
+            await wait_until(lambda: not audio_file.exists())
+        finally:
+            release.set()
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert not pipeline.ready_audio
+
+    async def test_unplayable_audio_file_removed(self, pipeline, monkeypatch):
+        """Test the audio file is deleted when no player can play it."""
+        saved = []
+
+        def recording_save_audio(*args):
+            saved.append(save_audio(*args))
+            return saved[-1]
+
+        monkeypatch.setattr(
+            "claude_code_tts_server.core.audio_manager.save_audio", recording_save_audio
+        )
+
+        await pipeline.start()
+        try:
+            await pipeline.add_message("Nobody hears this")
+            await wait_until(lambda: saved and not saved[0].exists())
+        finally:
+            await pipeline.stop()
+
+    async def test_playback_finish_wakes_worker(self, pipeline, monkeypatch):
+        """Test the playback worker notices a finished player without polling."""
+        # Player that ignores the file and exits after a short while
+        monkeypatch.setattr(
+            "claude_code_tts_server.core.playback.get_player",
+            lambda: ["sh", "-c", "sleep 0.1", "sh"],
+        )
+        saved = []
+
+        def recording_save_audio(*args):
+            saved.append(save_audio(*args))
+            return saved[-1]
+
+        monkeypatch.setattr(
+            "claude_code_tts_server.core.audio_manager.save_audio", recording_save_audio
+        )
+
+        await pipeline.start()
+        try:
+            await pipeline.add_message("Done")
+            await wait_until(lambda: saved and not saved[0].exists())
+        finally:
+            await pipeline.stop()
+
+    async def test_start_stop(self, pipeline):
+        """Test the pipeline starts and stops cleanly."""
+        await pipeline.start()
+        assert pipeline.sounds.chime_file is not None
+
+        await pipeline.stop()
+        assert pipeline.sounds.chime_file is None
@@ -0,0 +1,79 @@
+"""Tests for configuration loading."""
+
+import os
+
+import pytest
+
+from claude_code_tts_server.config import ServerConfig
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch, tmp_path):
+    """Isolate config from the developer's environment and .env file."""
+    monkeypatch.chdir(tmp_path)
+    # from_cli_args loads .env into os.environ; keep that local to the test
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    for var in ("TTS_KOKORO_VOICE", "AUDIO_SPEED", "AUDIO_QUEUE", "SUMMARY_BACKEND", "SUMMARY_AUDIO_PORT"):
+        monkeypatch.delenv(var, raising=False)
+
+
+class TestFromCliArgs:
+    """Tests for ServerConfig.from_cli_args."""
+
+    def test_defaults_when_no_args(self):
+        """Test that unset (None) CLI args leave defaults in place."""
+        config = ServerConfig.from_cli_args(host=None, port=None, speed=None)
+
+        assert config.host == "127.0.0.1"
+        assert config.port == 20202
+        assert config.audio.speed == 1.0
+        assert config.tts.kokoro_voice == "af_heart"
+        assert config.max_connections == 64
+
+    def test_routes_args_to_sections(self):
+        """Test that CLI args land on the right nested config field."""
+        config = ServerConfig.from_cli_args(
+            port=30303,
+            tts="kokoro",
+            kokoro_voice="am_adam",
+            summarizer="ollama",
+            ollama_url="http://gpu-box:11434",
+            queue=False,
+            speed=1.3,
+        )
+
+        assert config.port == 30303
+        assert config.tts.backend == "kokoro"
+        assert config.tts.kokoro_voice == "am_adam"
+        assert config.summarizer.backend == "ollama"
+        assert config.summarizer.ollama_url == "http://gpu-box:11434"
+        assert config.audio.queue is False
+        assert config.audio.speed == 1.3
+
+    def test_args_override_env(self, monkeypatch):
+        """Test that CLI args take precedence over env vars."""
+        monkeypatch.setenv("TTS_KOKORO_VOICE", "bf_emma")
+        monkeypatch.setenv("AUDIO_SPEED", "1.5")
+
+        config = ServerConfig.from_cli_args(kokoro_voice="am_adam")
+
+        assert config.tts.kokoro_voice == "am_adam"
+        assert config.audio.speed == 1.5
+
+    def test_unknown_arg(self):
+        """Test that an unknown CLI arg is rejected."""
+        with pytest.raises(TypeError, match="voice"):
+            ServerConfig.from_cli_args(voice="am_adam")
+
+    def test_reads_env_file(self, tmp_path, monkeypatch):
+        """Test that .env is applied, with real env vars taking precedence."""
+        (tmp_path / ".env").write_text(
+            "TTS_KOKORO_VOICE=bf_emma\nAUDIO_SPEED=1.2\nSUMMARY_AUDIO_PORT=30303\n"
+        )
+        monkeypatch.setenv("AUDIO_SPEED", "1.4")
+
+        config = ServerConfig.from_cli_args()
+
+        assert config.tts.kokoro_voice == "bf_emma"
+        assert config.audio.speed == 1.4
+        assert config.port == 30303
@@ -0,0 +1,114 @@
+"""Tests for audio playback."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from claude_code_tts_server.core.playback import AudioPlayer, get_player
+
+
+@pytest.fixture
+def sleep_player(monkeypatch):
+    """Player command that ignores the file and runs for the given time."""
+
+    def use(seconds: float) -> None:
+        monkeypatch.setattr(
+            "claude_code_tts_server.core.playback.get_player",
+            lambda: ["sh", "-c", f"sleep {seconds}", "sh"],
+        )
+
+    return use
+
+
+def test_get_player_cached():
+    """Test the player is only detected once."""
+    get_player.cache_clear()
+    assert get_player() is get_player()
+    assert get_player.cache_info().misses == 1
+
+
+def test_get_player_searches_path(monkeypatch):
+    """Test the first player found on PATH is used."""
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/paplay" if name == "paplay" else None)
+    get_player.cache_clear()
+    try:
+        assert get_player() == ["paplay"]
+    finally:
+        get_player.cache_clear()
+
+
+class TestAudioPlayer:
+    """Tests for AudioPlayer class."""
+
+    async def test_play_until_finished(self, sleep_player):
+        """Test playback state and the finished callback."""
+        sleep_player(0.05)
+        finished = asyncio.Event()
+        player = AudioPlayer(on_finished=finished.set)
+
+        assert await player.play(Path("speech.wav"))
+        assert player.is_playing()
+        assert player.check_finished() is None
+
+        await asyncio.wait_for(finished.wait(), timeout=1.0)
+
+        assert not player.is_playing()
+        assert player.check_finished() == Path("speech.wav")
+        assert player.check_finished() is None
+
+    async def test_stop(self, sleep_player):
+        """Test stopping playback returns the file and ends the process."""
+        sleep_player(10)
+        player = AudioPlayer()
+
+        await player.play(Path("speech.wav"))
+        process = player.current_process
+
+        assert await player.stop() == Path("speech.wav")
+        assert process.returncode is not None
+        assert not player.is_playing()
+        assert player.get_elapsed_time() is None
+
+    async def test_no_player(self, monkeypatch):
+        """Test play fails cleanly without a player."""
+        monkeypatch.setattr("claude_code_tts_server.core.playback.get_player", lambda: None)
+        player = AudioPlayer()
+
+        assert not await player.play(Path("speech.wav"))
+        assert not player.is_playing()
+
+    async def test_play_chime_stops_after_max_wait(self, sleep_player):
+        """Test a long chime is cut off after max_wait."""
+        sleep_player(10)
+        player = AudioPlayer()
+
+        async with asyncio.timeout(1.0):
+            await player.play_chime(Path("chime.wav"), max_wait=0.05)
+
+    async def test_play_drop_sound(self, sleep_player):
+        """Test the drop tone plays in the background."""
+        sleep_player(0)
+        player = AudioPlayer()
+
+        player.play_drop_sound(Path("drop.wav"))
+        assert len(player._sound_tasks) == 1
+
+        (process,) = await asyncio.gather(*player._sound_tasks)
+        assert not player._sound_tasks
+        assert await process.wait() == 0
+
+    async def test_play_drop_sound_spawn_failure_logged(self, monkeypatch, caplog):
+        """Test a player that fails to start is logged, not left unretrieved."""
+        monkeypatch.setattr(
+            "claude_code_tts_server.core.playback.get_player", lambda: ["/nonexistent/player"]
+        )
+        player = AudioPlayer()
+
+        player.play_drop_sound(Path("drop.wav"))
+        await asyncio.gather(*player._sound_tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert not player._sound_tasks
+        assert "Drop tone failed" in caplog.text
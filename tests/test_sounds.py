@@ -11,6 +11,7 @@ from claude_code_tts_server.core.sounds import (
     generate_chime,
     generate_drop_tone,
     save_audio,
+    write_wav,
 )
 
 
@@ -42,6 +43,13 @@ class TestGenerateChime:
         chime = generate_chime()
         assert np.max(np.abs(chime)) <= 1.0
 
+    def test_cached_read_only(self):
+        """Test that chime is cached per sample rate and cannot be modified."""
+        chime = generate_chime(24000)
+        assert generate_chime(24000) is chime
+        assert generate_chime(44100) is not chime
+        assert not chime.flags.writeable
+
 
 class TestGenerateDropTone:
     """Tests for generate_drop_tone function."""
@@ -68,6 +76,12 @@ class TestGenerateDropTone:
         tone = generate_drop_tone()
         assert np.max(np.abs(tone)) <= 1.0
 
+    def test_cached_read_only(self):
+        """Test that drop tone is cached per sample rate and cannot be modified."""
+        tone = generate_drop_tone(24000)
+        assert generate_drop_tone(24000) is tone
+        assert not tone.flags.writeable
+
 
 class TestSaveAudio:
     """Tests for save_audio function."""
@@ -97,6 +111,30 @@ class TestSaveAudio:
         # Cleanup
         os.unlink(path)
 
+    def test_pcm16_round_trip(self):
+        """Test that audio is written as 16-bit PCM and reads back within quantization error."""
+        import soundfile as sf
+
+        audio = np.linspace(-1, 1, 2400, dtype=np.float32)
+        path = save_audio(audio, 24000)
+
+        assert sf.info(path).subtype == "PCM_16"
+        data, _ = sf.read(path, dtype="float32")
+        assert np.max(np.abs(data - audio)) < 1e-4
+
+        os.unlink(path)
+
+    def test_clips_out_of_range(self):
+        """Test that samples outside [-1, 1] are clipped rather than wrapped."""
+        import soundfile as sf
+
+        path = save_audio(np.array([2.0, -2.0], dtype=np.float32))
+
+        data, _ = sf.read(path, dtype="int16")
+        assert data.tolist() == [32767, -32767]
+
+        os.unlink(path)
+
     def test_speed_requires_rubberband(self):
         """Test that speed != 1.0 requires rubberband (Python package + CLI tool)."""
         import shutil
@@ -129,8 +167,8 @@ class TestSaveAudio:
 class TestSoundManager:
     """Tests for SoundManager class."""
 
-    def test_init_sounds(self):
-        """Test that init_sounds creates files."""
+    def test_init_sounds(self, sound_cache):
+        """Test that init_sounds creates files in the cache directory."""
         manager = SoundManager()
         manager.init_sounds()
 
@@ -138,11 +176,35 @@ class TestSoundManager:
         assert manager.drop_file is not None
         assert manager.chime_file.exists()
         assert manager.drop_file.exists()
+        assert manager.chime_file.parent == sound_cache
 
         manager.cleanup()
 
-    def test_cleanup(self):
-        """Test that cleanup removes files."""
+    def test_init_sounds_reuses_cache(self, monkeypatch):
+        """Test that cached files are not regenerated."""
+        SoundManager().init_sounds()
+
+        def fail(sample_rate):
+            raise AssertionError("sound regenerated")
+
+        monkeypatch.setattr("claude_code_tts_server.core.sounds.generate_chime", fail)
+        monkeypatch.setattr("claude_code_tts_server.core.sounds.generate_drop_tone", fail)
+
+        manager = SoundManager()
+        manager.init_sounds()
+        assert manager.chime_file.exists()
+
+    def test_cache_per_sample_rate(self):
+        """Test that each sample rate gets its own cached files."""
+        manager_24k = SoundManager(24000)
+        manager_44k = SoundManager(44100)
+        manager_24k.init_sounds()
+        manager_44k.init_sounds()
+
+        assert manager_24k.chime_file != manager_44k.chime_file
+
+    def test_cleanup_keeps_cached_files(self):
+        """Test that cleanup releases but does not delete cached files."""
         manager = SoundManager()
         manager.init_sounds()
 
@@ -153,17 +215,38 @@ class TestSoundManager:
 
         assert manager.chime_file is None
         assert manager.drop_file is None
+        assert chime_path.exists()
+        assert drop_path.exists()
+
+    def test_unwritable_cache_falls_back_to_temp_files(self, sound_cache):
+        """Test that temp files are used (and cleaned up) if the cache is unwritable."""
+        sound_cache.parent.mkdir(parents=True)
+        sound_cache.write_text("not a directory")
+
+        manager = SoundManager()
+        manager.init_sounds()
+
+        chime_path = manager.chime_file
+        assert chime_path.exists()
+        assert chime_path.parent != sound_cache
+
+        manager.cleanup()
         assert not chime_path.exists()
-        assert not drop_path.exists()
 
-    def test_cleanup_handles_missing_files(self):
-        """Test that cleanup handles already-deleted files."""
+    def test_failed_cache_write_leaves_no_partial_file(self, sound_cache, monkeypatch):
+        """Test that a cache write failing partway removes its temp file."""
+        def failing_write_wav(path, audio, sample_rate):
+            if path.parent == sound_cache:
+                path.write_bytes(b"RIFF")
+                raise OSError("No space left on device")
+            write_wav(path, audio, sample_rate)
+
+        monkeypatch.setattr("claude_code_tts_server.core.sounds.write_wav", failing_write_wav)
+
         manager = SoundManager()
         manager.init_sounds()
 
-        # Manually delete files
-        os.unlink(manager.chime_file)
-        os.unlink(manager.drop_file)
+        assert manager.chime_file.exists()
+        assert list(sound_cache.iterdir()) == []
 
-        # Should not raise
         manager.cleanup()
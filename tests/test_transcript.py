@@ -43,6 +43,30 @@ class TestParseTranscript:
         # Should not include the dangerous command
         assert "rm -rf" not in result.content
 
+    @pytest.mark.parametrize(
+        "result_text",
+        [
+            "The user doesn\u2019t want to proceed with this tool use.",
+            "THE USER DOESN'T WANT TO PROCEED",
+            "Error: tool use was rejected",
+        ],
+    )
+    def test_interrupt_variants(self, result_text):
+        """Test interrupt detection ignores case and apostrophe style."""
+        entries = [
+            {"type": "user", "message": {"content": [{"type": "text", "text": "Go"}]}},
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "Old"}]}},
+            {
+                "type": "user",
+                "message": {"content": [{"type": "tool_result", "content": result_text}]},
+            },
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "New"}]}},
+        ]
+
+        result = parse_transcript(_entries_to_jsonl(entries))
+
+        assert result.content == "New"
+
     def test_parse_empty_content(self):
         """Test parsing empty content."""
         assert parse_transcript("") is None
@@ -54,6 +78,39 @@ class TestParseTranscript:
         result = parse_transcript("not valid json")
         assert result is None
 
+    def test_parse_blank_lines_and_crlf(self, sample_transcript_jsonl):
+        """Test blank lines and CRLF line endings are tolerated."""
+        content = "\r\n\r\n".join(sample_transcript_jsonl.split("\n")) + "\n  \n"
+        result = parse_transcript(content)
+
+        assert result is not None
+        assert result.content == "Of course! I'd be happy to help you."
+
+    def test_other_entry_types_ignored(self, sample_transcript_jsonl):
+        """Test entries that are neither user nor assistant messages are skipped."""
+        other = [
+            {"type": "summary", "summary": "Earlier work", "leafUuid": "abc"},
+            {"type": "file-history-snapshot", "snapshot": {"files": ["a.py"]}},
+        ]
+        content = sample_transcript_jsonl + "\n" + _entries_to_jsonl(other)
+
+        for transcript in (content, content.encode()):
+            result = parse_transcript(transcript)
+            assert result.content == "Of course! I'd be happy to help you."
+
+    def test_parse_bytes(self, sample_transcript_with_tools):
+        """Test bytes content parses the same as str."""
+        from_bytes = parse_transcript(sample_transcript_with_tools.encode())
+
+        assert from_bytes == parse_transcript(sample_transcript_with_tools)
+
+    def test_parse_bytes_invalid_utf8(self, sample_transcript_jsonl):
+        """Test lines with invalid UTF-8 are kept with replacement characters."""
+        content = sample_transcript_jsonl.encode().replace(b"Of course!", b"Of course\xff")
+        result = parse_transcript(content)
+
+        assert result.content == "Of course\ufffd I'd be happy to help you."
+
     def test_parse_transcript_truncates_long_values(self):
         """Test that long tool input values are truncated."""
         long_value = "x" * 200
@@ -183,6 +240,23 @@ class TestParseTranscript:
         assert result.length <= 20100  # 20k + prefix overhead
         assert result.has_tool_calls is True
 
+    def test_tool_call_before_truncated_content(self):
+        """Test tool calls are reported even when their text is truncated away."""
+        entries = [
+            {"type": "user", "message": {"content": [{"type": "text", "text": "Start"}]}},
+            {
+                "type": "assistant",
+                "message": {"content": [{"type": "tool_use", "name": "Bash", "input": {}}]},
+            },
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "z" * 500}]}},
+        ]
+
+        result = parse_transcript(_entries_to_jsonl(entries), max_content_length=100)
+
+        assert result.truncated is True
+        assert "[Tool: Bash]" not in result.content
+        assert result.has_tool_calls is True
+
     def test_parse_transcript_custom_max_length(self):
         """Test custom max content length."""
         entries = [